@@ -94,8 +94,10 @@ def iterative_explore(team1, team2, max_iterations=100):
         team1[i].set_assigned_role(i)
         team2[i].set_assigned_role(i)
 
+    # Roles are not reassigned while exploring, so each player's score is fixed for this search.
+    scores = player_scores(team1 + team2)
     best_teams = (team1[:], team2[:])
-    best_fitness = fitness(team1, team2)
+    best_fitness = scored_fitness(team1, team2, scores)
     # Can have iterative_explore return a set so can check previous iterations exploration
     # Instead of making a new one each time
     visited = set()
@@ -108,7 +110,7 @@ def iterative_explore(team1, team2, max_iterations=100):
 
     while stack and iterations < max_iterations:
         current_team1, current_team2 = stack.pop()
-        current_fit = fitness(current_team1, current_team2)
+        current_fit = scored_fitness(current_team1, current_team2, scores)
         if current_fit < best_fitness:
             best_fitness = current_fit
             best_teams = (current_team1[:], current_team2[:])
@@ -144,7 +146,7 @@ def iterative_explore(team1, team2, max_iterations=100):
                     state_key = tuple(p.discord_id for p in new_team1 + new_team2)
                     if state_key not in visited:
                         visited.add(state_key)
-                        new_fit = fitness(new_team1, new_team2)
+                        new_fit = scored_fitness(new_team1, new_team2, scores)
                         if new_fit < best_fitness:
                             best_fitness = new_fit
                             best_teams = (new_team1[:], new_team2[:])
@@ -173,16 +175,31 @@ def explore_teams(players):
     return best_teams, min_team_diff
 
 def fitness(team1, team2):
-    global role_prio
+    return scored_fitness(team1, team2, player_scores(team1 + team2))
+
+def player_scores(players):
+    """
+    Maps each player's discord_id to (prowess, assigned role preference),
+    the two values scored_fitness reads from a player.
+    """
+    return {p.discord_id: (p.calc_prowess(), p.get_assigned_role_pref()) for p in players}
+
+def scored_fitness(team1, team2, scores):
+    """
+    Fitness of a team split, reading each player's values from player_scores
+    so they aren't recomputed for every candidate split.
+    """
+    team1_scores = [scores[p.discord_id] for p in team1]
+    team2_scores = [scores[p.discord_id] for p in team2]
     diff = 0
     # Sum differences in calculated prowess for corresponding roles.
     for x in range(5):
-        diff += abs(team1[x].calc_prowess() - team2[x].calc_prowess())
+        diff += abs(team1_scores[x][0] - team2_scores[x][0])
     # Add penalty based on role preferences if role priority is enabled.
     if role_prio == 1:
         for x in range(5):
-            diff += team1[x].get_assigned_role_pref()
-            diff += team2[x].get_assigned_role_pref()
+            diff += team1_scores[x][1]
+            diff += team2_scores[x][1]
     return diff
 
 def print_team(team, name):
@@ -7,21 +7,33 @@ channel configuration, check-in management, and game administration.
 import discord
 from discord import app_commands
 import os
-import sys
 from typing import List, Optional
 from dotenv import find_dotenv, set_key
 
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import from local package using relative paths
 from ..utils import helpers
 from ..ui.check_in import StartGameView
 
 import databaseManager
 
+# Static error embeds shared by the admin commands; never mutate these
+_PERMISSION_ERROR_EMBED = discord.Embed(
+    title="Permission Error",
+    description="You don't have permission to use this command.",
+    color=discord.Color.red()
+)
+_INVALID_CHANNEL_EMBED = discord.Embed(
+    title="Invalid Channel",
+    description="Check-in commands cannot be run in the admin channel.",
+    color=discord.Color.red()
+)
+_CHECKIN_ACTIVE_EMBED = discord.Embed(
+    title="Check-in Already Active",
+    description="There is already an active check-in session. Please complete or cancel it before starting a new one.",
+    color=discord.Color.red()
+)
+
+
 def setup_admin_commands(bot, MY_GUILD):
     """
     Set up admin commands for the bot.
@@ -39,7 +51,7 @@ def setup_admin_commands(bot, MY_GUILD):
     async def create_admin_channel(interaction: discord.Interaction):
         """Sets the current channel as the admin channel for tournament management."""
         # Check if user has admin permissions
-        if not helpers.has_admin_permission(interaction.user):
+        if not helpers.has_admin_permission_cached(interaction.user):
             await interaction.response.send_message(
                 "You don't have permission to use this command.",
                 ephemeral=True
@@ -63,13 +75,9 @@ def setup_admin_commands(bot, MY_GUILD):
     async def checkin(interaction: discord.Interaction):
         """Command to start a check-in process for a game."""
         # Check if user has admin permissions
-        if not helpers.has_admin_permission(interaction.user):
+        if not helpers.has_admin_permission_cached(interaction.user):
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Permission Error",
-                    description="You don't have permission to use this command.",
-                    color=discord.Color.red()
-                ),
+                embed=_PERMISSION_ERROR_EMBED,
                 ephemeral=True
             )
             return
@@ -78,11 +86,7 @@ def setup_admin_commands(bot, MY_GUILD):
         admin_channel_id = os.getenv("ADMIN_CHANNEL")
         if admin_channel_id and str(interaction.channel.id) == admin_channel_id:
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Invalid Channel",
-                    description="Check-in commands cannot be run in the admin channel.",
-                    color=discord.Color.red()
-                ),
+                embed=_INVALID_CHANNEL_EMBED,
                 ephemeral=True
             )
             return
@@ -93,11 +97,7 @@ def setup_admin_commands(bot, MY_GUILD):
         # Check if there is an existing check-in active
         if main_module.current_checkin_view is not None:
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Check-in Already Active",
-                    description="There is already an active check-in session. Please complete or cancel it before starting a new one.",
-                    color=discord.Color.red()
-                ),
+                embed=_CHECKIN_ACTIVE_EMBED,
                 ephemeral=True
             )
             return
@@ -188,13 +188,9 @@ def setup_admin_commands(bot, MY_GUILD):
             end_id: Ending ID in the range
         """
         # Check if user has admin permissions
-        if not helpers.has_admin_permission(interaction.user):
+        if not helpers.has_admin_permission_cached(interaction.user):
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Permission Error",
-                    description="You don't have permission to use this command.",
-                    color=discord.Color.red()
-                ),
+                embed=_PERMISSION_ERROR_EMBED,
                 ephemeral=True
             )
             return
@@ -203,11 +199,7 @@ def setup_admin_commands(bot, MY_GUILD):
         admin_channel_id = os.getenv("ADMIN_CHANNEL")
         if admin_channel_id and str(interaction.channel.id) == admin_channel_id:
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Invalid Channel",
-                    description="Check-in commands cannot be run in the admin channel.",
-                    color=discord.Color.red()
-                ),
+                embed=_INVALID_CHANNEL_EMBED,
                 ephemeral=True
             )
             return
@@ -218,11 +210,7 @@ def setup_admin_commands(bot, MY_GUILD):
         # Check if there is an existing check-in active
         if main_module.current_checkin_view is not None:
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    title="Check-in Already Active",
-                    description="There is already an active check-in session. Please complete or cancel it before starting a new one.",
-                    color=discord.Color.red()
-                ),
+                embed=_CHECKIN_ACTIVE_EMBED,
                 ephemeral=True
             )
             return
@@ -242,7 +230,7 @@ def setup_admin_commands(bot, MY_GUILD):
         # Add dummy members to the check-in list
         from Scripts.TournamentBot.ui.check_in import DummyMember
         for i in range(start_id, end_id + 1):
-            view.checked_in_users.append(DummyMember(i))
+            view.add_checked_in_user(DummyMember(i))
         
         # Update the embed with the user list
         user_list = []
@@ -306,7 +294,7 @@ def setup_admin_commands(bot, MY_GUILD):
             discord_id: Discord ID of the player to update toxicity for
         """
         # Check if user has admin permissions
-        if not helpers.has_admin_permission(interaction.user):
+        if not helpers.has_admin_permission_cached(interaction.user):
             await interaction.response.send_message(
                 "You don't have permission to use this command.",
                 ephemeral=True
@@ -6,20 +6,13 @@ stats viewing, account linking, role preferences, and toxicity management.
 """
 import discord
 from discord import app_commands
-import sys
-import os
 from typing import List, Optional
 
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import from local package using relative paths
 from ..utils import helpers
 from ..ui.role_preference import create_role_preference_ui
 
-# Import from parent directory
+# Import from the Scripts directory (main.py puts it on sys.path)
 import databaseManager
 
 def setup_player_commands(bot, MY_GUILD):
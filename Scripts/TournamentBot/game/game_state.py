@@ -6,23 +6,26 @@ team assignment, MVP voting, and result tracking.
 """
 import discord
 import asyncio
+import collections
+import logging
 import random
 from typing import List, Dict, Any, Optional, Tuple, Union, Set, Callable
-import sys
-import os
-
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from local package using relative paths
 from ..utils import helpers
 
-# Import from parent directory
+# Import from the Scripts directory (main.py puts it on sys.path)
 import databaseManager
 import Matchmaking
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of background database writes allowed to run at once
+MAX_BACKGROUND_DB_TASKS = 4
+
+# Maximum number of Discord message edits sent concurrently by one batch
+MAX_CONCURRENT_MESSAGE_EDITS = 5
+
 class GlobalGameState:
     """
     Manages the global state of all games in the tournament.
@@ -50,6 +53,8 @@ class GlobalGameState:
         Reset the singleton instance.
         Useful for testing or when a fresh state is needed.
         """
+        if cls._instance is not None:
+            cls._instance.release_messages()
         cls._instance = None
     
     def __init__(self, games: list = None, sitting_out: list = None, public_channel=None):
@@ -68,10 +73,12 @@ class GlobalGameState:
         
         # Game and voting status
         self.game_results = {}  # Maps game index to "blue" or "red"
-        self.mvp_voting_active = {}  # Maps game index to voting status
-        self.mvp_votes = {}  # Maps game index to {voter_id: voted_for_id}
+        self.mvp_voting_active = [False] * len(self.games)  # Voting status, indexed by game
+        self.mvp_votes = [{} for _ in self.games]  # {voter_id: voted_for_id}, indexed by game
         self.mvp_vote_messages = {}  # {game_index: message}
         self.mvp_admin_messages = {}  # {game_index: message}
+        self.controls_cleared = set()  # Game indexes whose control message has no buttons left
+        self.mvp_resolved = set()  # Game indexes whose MVP step was skipped, ended or cancelled
         self.current_voting_game = None  # Currently active voting game index
         
         # State flags
@@ -81,6 +88,50 @@ class GlobalGameState:
         
         # Auto-end voting timers
         self.mvp_voting_timers = {}
+        
+        # Aggregate resolution counters, kept in sync by record_result/set_mvp_voting_active
+        self.pending_results = len(self.games)  # Games without a declared winner
+        self.pending_mvp = 0  # Games with MVP voting in progress
+        
+        # Background database writes scheduled off the interaction path
+        self._db_semaphore = asyncio.Semaphore(MAX_BACKGROUND_DB_TASKS)
+        self._background_tasks = set()
+        
+        # Bounds concurrent message edits issued by run_message_edits
+        self._edit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_MESSAGE_EDITS)
+        
+        # Rendered game embeds, keyed by game index -> (state key, embed)
+        self._embed_cache = {}
+        
+        # Live GameControlView per game index, reused when only labels change
+        self.game_views = {}
+        # Live SittingOutView, reused the same way
+        self.sitting_out_view = None
+        
+        # Per-game locks serializing result/MVP changes and their message edits
+        self._locks = collections.defaultdict(asyncio.Lock)
+    
+    def release_messages(self) -> None:
+        """
+        Drop the message and view references held for this session.
+        
+        Stopping the game control views removes them from the client's view
+        store. Otherwise they stay registered for the life of the process and
+        keep this state and its messages alive after the session ends.
+        """
+        for view in self.game_views.values():
+            view.stop()
+        self.game_views = {}
+        if self.sitting_out_view is not None:
+            self.sitting_out_view.stop()
+            self.sitting_out_view = None
+        self.message_references = {}
+        self.game_messages = {}
+        self.mvp_vote_messages = {}
+        self.mvp_admin_messages = {}
+        self.sitting_out_message = None
+        self.global_controls_message = None
+        self._embed_cache = {}
     
     def is_initialized(self) -> bool:
         """Check if the game state has been initialized with games."""
@@ -110,22 +161,149 @@ class GlobalGameState:
         self.sitting_out_message = None
         self.global_controls_message = None
         self.game_results = {}
-        self.mvp_voting_active = {}
-        self.mvp_votes = {}
+        self.mvp_voting_active = [False] * len(games)
+        self.mvp_votes = [{} for _ in games]
         self.mvp_vote_messages = {}
         self.mvp_admin_messages = {}
         self.swap_mode = False
         self.finalized = False
         self.selected = None
         self.current_voting_game = None
+        self.controls_cleared = set()
+        self.mvp_resolved = set()
+        self._embed_cache = {}
+        self.game_views = {}
+        self.sitting_out_view = None
         
         # Store the games directly since matchmaking was already done
         self.games = games
         
-        # Initialize voting state for each game
+        # Initialize player lookups for each game
         for i in range(len(games)):
-            self.mvp_voting_active[i] = False
-            self.mvp_votes[i] = {}
+            self.index_game_players(i)
+        
+        self.pending_results = len(games)
+        self.pending_mvp = 0
+    
+    def index_game_players(self, game_index: int) -> None:
+        """
+        Precompute player ID lookups for a game.
+        
+        Stores "blue_ids" and "red_ids" (sets of Discord IDs per team),
+        "participant_ids" (both teams) and "id_to_name" (Discord ID to username)
+        on the game dictionary. Must be called again whenever the teams change.
+        
+        Args:
+            game_index: Index of the game
+        """
+        game = self.games[game_index]
+        players = game["blue"] + game["red"]
+        game["blue_ids"] = frozenset(player.discord_id for player in game["blue"])
+        game["red_ids"] = frozenset(player.discord_id for player in game["red"])
+        game["participant_ids"] = game["blue_ids"] | game["red_ids"]
+        game["id_to_name"] = {player.discord_id: player.username for player in players}
+    
+    def game_lock(self, game_index: int) -> asyncio.Lock:
+        """
+        Get the lock guarding result and MVP changes for a game.
+        
+        Hold it only around the state change and the matching message edit.
+        The lock is not re-entrant, so do not acquire it from code that is
+        already running under it.
+        
+        Args:
+            game_index: Index of the game
+            
+        Returns:
+            The asyncio.Lock for this game
+        """
+        return self._locks[game_index]
+    
+    def record_result(self, game_index: int, result: str) -> None:
+        """
+        Record the winning team for a game.
+        
+        Args:
+            game_index: Index of the game
+            result: Winning team, either "blue" or "red"
+        """
+        if game_index not in self.game_results:
+            self.pending_results -= 1
+        self.game_results[game_index] = result
+        self.games[game_index]["result"] = result
+    
+    def set_mvp_voting_active(self, game_index: int, active: bool) -> None:
+        """
+        Mark MVP voting for a game as active or inactive.
+        
+        Args:
+            game_index: Index of the game
+            active: Whether MVP voting is in progress
+        """
+        was_active = self.mvp_voting_active[game_index]
+        if active and not was_active:
+            self.pending_mvp += 1
+        elif was_active and not active:
+            self.pending_mvp -= 1
+        self.mvp_voting_active[game_index] = active
+    
+    def all_games_resolved(self) -> bool:
+        """Check if every game has a winner and no MVP voting is in progress."""
+        return not self.pending_results and not self.pending_mvp
+    
+    def run_db_task(self, coro, interaction: Optional[discord.Interaction] = None) -> asyncio.Task:
+        """
+        Run a database coroutine in the background so interactions can be answered first.
+        
+        Args:
+            coro: Coroutine performing the database writes
+            interaction: Interaction to notify with a followup if the writes fail
+            
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(self._run_db_task(coro, interaction))
+        # Keep a strong reference so the task isn't garbage collected mid-flight
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _run_db_task(self, coro, interaction: Optional[discord.Interaction]) -> None:
+        """Await a background database coroutine, bounded by the task semaphore."""
+        async with self._db_semaphore:
+            try:
+                await coro
+            except Exception as e:
+                logger.exception("Error updating database")
+                if interaction is not None:
+                    await helpers.safe_respond(
+                        interaction,
+                        content=f"Error saving match data: {str(e)}",
+                        ephemeral=True
+                    )
+    
+    async def persist_match_result(self, game_index: int, result: str, mvp_id: Optional[str] = None) -> None:
+        """
+        Store a finished match and update every player's statistics.
+        
+        Args:
+            game_index: Index of the game
+            result: Winning team, either "blue" or "red"
+            mvp_id: Discord ID of the MVP, or None if no MVP was chosen
+        """
+        game = self.games[game_index]
+        await databaseManager.store_match_data(game, result, mvp_id)
+        await databaseManager.update_all_player_stats(game, result, mvp_id)
+    
+    async def persist_win(self, winner_ids, loser_ids) -> None:
+        """
+        Update win and games played stats once a winner is declared.
+        
+        Args:
+            winner_ids: Discord IDs of the players on the winning team
+            loser_ids: Discord IDs of the players on the losing team
+        """
+        await databaseManager.update_match_results_bulk(winner_ids, loser_ids)
     
     def _format_team_data(self, players: list) -> tuple:
         """
@@ -138,13 +316,14 @@ class GlobalGameState:
         - col3: Role Preference list with each role preceded by its emoji and the role bolded.
         """
         primary_roles = helpers.ROLE_NAMES  # ["Top", "Jun", "Mid", "Bot", "Sup"]
+        role_emojis = helpers.ROLE_EMOJIS
         col1_lines = []
         col2_lines = []
         col3_lines = []
         
         for i, player in enumerate(players):
             primary_role = primary_roles[i]
-            emoji = helpers.ROLE_EMOJIS.get(primary_role, "")
+            emoji = role_emojis.get(primary_role, "")
             col1_lines.append(f"{emoji} **{primary_role}**: {player.username}")
             
             # Combined tier and rank column.
@@ -154,7 +333,7 @@ class GlobalGameState:
             role_prefs = player.get_priority_role_preference()
             if role_prefs:
                 formatted_prefs = ", ".join(
-                    f"{helpers.ROLE_EMOJIS.get(role, '')} **{role}**" for role in role_prefs
+                    f"{role_emojis.get(role, '')} **{role}**" for role in role_prefs
                 )
             else:
                 formatted_prefs = "None"
@@ -174,6 +353,9 @@ class GlobalGameState:
         1. Field: [Team] Primary Role (with emoji) & Username.
         2. Field: Combined Tier and Rank.
         3. Field: Role Preference (each role bolded with its emoji).
+        
+        The embed is cached per game and rebuilt only when the rosters or result
+        change, so callers must treat the returned embed as read-only.
         """
         if game_index >= len(self.games):
             return discord.Embed(
@@ -183,6 +365,15 @@ class GlobalGameState:
             )
         
         game = self.games[game_index]
+        key = (
+            game.get("result"),
+            tuple(player.discord_id for player in game["blue"]),
+            tuple(player.discord_id for player in game["red"]),
+        )
+        cached = self._embed_cache.get(game_index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
         embed = discord.Embed(title=f"Game {game_index+1}", color=discord.Color.blue())
         
         # Blue Team fields
@@ -202,6 +393,7 @@ class GlobalGameState:
             result_text = f"{game['result'].capitalize()} Team Wins!"
             embed.add_field(name="Result", value=result_text, inline=False)
         
+        self._embed_cache[game_index] = (key, embed)
         return embed
     
     def generate_sitting_out_embed(self) -> discord.Embed:
@@ -214,43 +406,110 @@ class GlobalGameState:
         embed.add_field(name="Players Sitting Out", value=sitting_out_str, inline=False)
         return embed
     
+    async def update_game_message(self, game_index: int):
+        """
+        Update the embed and controls of a single game's message.
+        
+        Args:
+            game_index: Index of the game to update
+        """
+        key = f"game_control_{game_index}"
+        if key not in self.message_references:
+            return
+        message = self.message_references[key]
+        embed = self.generate_embed(game_index)
+        
+        view = self.get_or_build_game_view(game_index)
+        
+        try:
+            await message.edit(embed=embed, view=view)
+        except Exception:
+            logger.exception("Failed to update message for Game %d", game_index + 1)
+    
+    def get_or_build_game_view(self, game_index: int):
+        """
+        Get the control view for a game, building one only when needed.
+        
+        The live view is reused, with its player buttons relabelled, as long as
+        its button layout still fits the current phase. Otherwise a new
+        GameControlView is built and registered in game_views.
+        
+        Args:
+            game_index: Index of the game
+            
+        Returns:
+            The GameControlView to attach to the game's message
+        """
+        view = self.game_views.get(game_index)
+        if view is not None and view.is_current():
+            view.refresh_player_labels()
+            return view
+        
+        # Import here to avoid circular imports
+        from ..ui.game_control import GameControlView
+        return GameControlView(self, game_index)
+    
+    def get_or_build_sitting_out_view(self):
+        """
+        Get the sitting out view, building one only when needed.
+        
+        Swaps keep the number of sitting out players fixed, so the live view is
+        reused with its buttons relabelled while it still has one per player.
+        
+        Returns:
+            The SittingOutView to attach to the sitting out message
+        """
+        view = self.sitting_out_view
+        if view is not None and len(view.children) == len(self.sitting_out):
+            view.refresh_player_labels()
+            return view
+        
+        # Import here to avoid circular imports
+        from ..ui.game_control import SittingOutView
+        return SittingOutView(self)
+    
+    async def update_sitting_out_message(self):
+        """Update the sitting out embed and its swap buttons."""
+        if "sitting_out" not in self.message_references:
+            return
+        message = self.message_references["sitting_out"]
+        sitting_out_embed = self.generate_sitting_out_embed()
+        try:
+            # Show the sitting out player buttons if swap mode is enabled and games aren't finalized
+            if self.swap_mode and not self.finalized:
+                view = self.get_or_build_sitting_out_view()
+                await message.edit(embed=sitting_out_embed, view=view)
+            else:
+                # Remove buttons when swap mode is off or games are finalized
+                await message.edit(embed=sitting_out_embed, view=None)
+        except Exception:
+            logger.exception("Failed to update sitting out message")
+    
     async def update_all_messages(self):
         """Update all game embeds and sitting out embed."""
-        # Update game control messages
-        for i in range(len(self.games)):
-            key = f"game_control_{i}"
-            if key in self.message_references:
-                message = self.message_references[key]
-                embed = self.generate_embed(i)
-                
-                # Import here to avoid circular imports
-                from ..ui.game_control import GameControlView
-                view = GameControlView(self, i)
-                
-                try:
-                    await message.edit(embed=embed, view=view)
-                except Exception as e:
-                    print(f"Failed to update message for Game {i+1}: {e}")
-        
-        # Update sitting out message
-        if "sitting_out" in self.message_references:
-            message = self.message_references["sitting_out"]
-            sitting_out_embed = self.generate_sitting_out_embed()
-            try:
-                # Import here to avoid circular imports
-                from ..ui.game_control import SittingOutView
-                
-                # Create a new view for sitting out players if swap mode is enabled and games aren't finalized
-                if self.swap_mode and not self.finalized:
-                    view = SittingOutView(self)
-                    await message.edit(embed=sitting_out_embed, view=view)
-                else:
-                    # Remove buttons when swap mode is off or games are finalized
-                    await message.edit(embed=sitting_out_embed, view=None)
-            except Exception as e:
-                print(f"Failed to update sitting out message: {e}")
-                
-        # Admin tracking functionality removed
+        # Update game control messages and the sitting out message together
+        edits = [(f"update message for Game {i+1}", self.update_game_message(i)) for i in range(len(self.games))]
+        edits.append(("update sitting out message", self.update_sitting_out_message()))
+        await self.run_message_edits(edits)
+    
+    async def run_message_edits(self, edits: List[Tuple[str, Any]]) -> None:
+        """
+        Await several message edits concurrently.
+        
+        At most MAX_CONCURRENT_MESSAGE_EDITS run at once. A failed edit is
+        logged and does not stop the others.
+        
+        Args:
+            edits: (description, coroutine) pairs; the description is used in the error log
+        """
+        async def limited(coro):
+            async with self._edit_semaphore:
+                return await coro
+        
+        results = await asyncio.gather(*(limited(coro) for _, coro in edits), return_exceptions=True)
+        for (description, _), result in zip(edits, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to %s", description, exc_info=result)
     
     async def start_mvp_voting(self, interaction: discord.Interaction, game_index: int):
         """Start MVP voting for a specific game."""
@@ -262,7 +521,7 @@ class GlobalGameState:
             )
             return
         
-        if self.mvp_voting_active.get(game_index, False):
+        if self.mvp_voting_active[game_index]:
             await interaction.response.send_message(
                 f"MVP voting for Game {game_index+1} is already active!",
                 ephemeral=True
@@ -270,7 +529,7 @@ class GlobalGameState:
             return
         
         # Mark this game as actively voting
-        self.mvp_voting_active[game_index] = True
+        self.set_mvp_voting_active(game_index, True)
         self.current_voting_game = game_index
         self.mvp_votes[game_index] = {}
         
@@ -322,7 +581,7 @@ class GlobalGameState:
             mention_msg = await public_channel.send(f"🏆 **Game {game_index+1} MVP Voting:** {player_mentions}")
             self.mvp_vote_messages[game_index] = voting_msg
         except Exception as e:
-            print(f"Error sending voting message to public channel: {e}")
+            logger.exception("Error sending voting message to public channel")
             await interaction.response.send_message(
                 f"Error sending voting message: {str(e)}",
                 ephemeral=True
@@ -340,7 +599,7 @@ class GlobalGameState:
 
     async def end_mvp_voting(self, interaction: discord.Interaction, game_index: int):
         """End MVP voting and tally results."""
-        if not self.mvp_voting_active.get(game_index, False):
+        if not self.mvp_voting_active[game_index]:
             await interaction.response.send_message(
                 f"No active MVP voting for Game {game_index+1}!",
                 ephemeral=True
@@ -357,7 +616,7 @@ class GlobalGameState:
             return
             
         # Tally votes
-        votes = self.mvp_votes.get(game_index, {})
+        votes = self.mvp_votes[game_index]
         vote_counts = {}
         
         for voted_id in votes.values():
@@ -390,11 +649,8 @@ class GlobalGameState:
         
         # Handle results display
         if mvp_player and max_votes > 0:
-            # Store match data in database
-            await databaseManager.store_match_data(self.games[game_index], result, mvp_id)
-            
-            # Update all player statistics in one call
-            await databaseManager.update_all_player_stats(self.games[game_index], result, mvp_id)
+            # Store match data and update all player statistics
+            await self.persist_match_result(game_index, result, mvp_id)
             
             # Nothing here - we moved the results_embed creation below
             
@@ -459,12 +715,13 @@ class GlobalGameState:
                 pass
         
         # Clean up voting state
-        self.mvp_voting_active[game_index] = False
+        self.set_mvp_voting_active(game_index, False)
+        self.mvp_resolved.add(game_index)
         self.current_voting_game = None
 
     async def cancel_mvp_voting(self, interaction: discord.Interaction, game_index: int, silent=False):
         """Cancel MVP voting without tallying results."""
-        if not self.mvp_voting_active.get(game_index, False):
+        if not self.mvp_voting_active[game_index]:
             if not silent:
                 await interaction.response.send_message(
                     f"No active MVP voting for Game {game_index+1}!",
@@ -477,12 +734,9 @@ class GlobalGameState:
         if result:
             # Since MVP voting was canceled, we treat it like skipping MVP
             # Store match data in database with NULL MVP
-            await databaseManager.store_match_data(self.games[game_index], result, None)
-            
-            # Update all player statistics
-            await databaseManager.update_all_player_stats(self.games[game_index], result, None)
+            await self.persist_match_result(game_index, result, None)
         else:
-            print(f"Error: No game result found for game {game_index}")
+            logger.error("No game result found for game %d", game_index)
         
         # Create cancellation embed
         cancel_embed = discord.Embed(
@@ -502,7 +756,8 @@ class GlobalGameState:
         # Admin message update functionality removed
         
         # Clean up voting state
-        self.mvp_voting_active[game_index] = False
+        self.set_mvp_voting_active(game_index, False)
+        self.mvp_resolved.add(game_index)
         self.current_voting_game = None
         
         if not silent:
@@ -534,10 +789,12 @@ class GlobalGameState:
             fake_interaction.response = fake_interaction
             
             # End the voting
-            await self.end_mvp_voting(fake_interaction, game_index)
+            async with self.game_lock(game_index):
+                if self.mvp_voting_active[game_index]:
+                    await self.end_mvp_voting(fake_interaction, game_index)
             
-        except Exception as e:
-            print(f"Error in auto_end_mvp_voting: {e}")
+        except Exception:
+            logger.exception("Error in auto_end_mvp_voting")
 
     async def handle_selection(self, interaction: discord.Interaction, game_index: int, team: str, player_index: int, player_name: str):
         """Handle player selection for swapping."""
@@ -574,8 +831,16 @@ class GlobalGameState:
                     self.games[first_game_index][first_team][first_player_index] = self.games[game_index][team][player_index]
                     self.games[game_index][team][player_index] = temp
 
+            # Refresh lookups and messages only for the rosters that changed
+            changed_games = sorted({first_game_index, game_index} - {None})
+            for changed_index in changed_games:
+                self.index_game_players(changed_index)
+
             self.selected = None
-            await self.update_all_messages()
+            edits = [(f"update message for Game {i+1}", self.update_game_message(i)) for i in changed_games]
+            if "sitting_out" in (first_team, team):
+                edits.append(("update sitting out message", self.update_sitting_out_message()))
+            await self.run_message_edits(edits)
             try:
                 await interaction.response.send_message("Players swapped!", ephemeral=True)
             except (discord.errors.NotFound, discord.errors.InteractionResponded):
@@ -589,4 +854,4 @@ class GlobalGameState:
             self.selected = None
         await self.update_all_messages()
         mode_str = "enabled (names revealed)" if self.swap_mode else "disabled (names hidden)"
-        await interaction.response.send_message(f"Swap mode {mode_str}.", ephemeral=True)
\ No newline at end of file
+        await helpers.safe_respond(interaction, f"Swap mode {mode_str}.", ephemeral=True)
\ No newline at end of file
@@ -33,6 +33,8 @@ sys.path.insert(0, parent_dir)
 from Scripts.TournamentBot.commands.admin_commands import setup_admin_commands
 from Scripts.TournamentBot.commands.player_commands import setup_player_commands
 from Scripts.TournamentBot.game.game_state import GlobalGameState
+from Scripts.TournamentBot.utils import helpers
+from Scripts.TournamentBot.ui import role_preference
 
 # Import modules from parent directory
 import databaseManager
@@ -52,7 +54,13 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+class TournamentBot(commands.Bot):
+    """Bot that stops its background workers when it shuts down."""
+    async def close(self):
+        await role_preference.close_preference_batcher()
+        await super().close()
+
+bot = TournamentBot(command_prefix="!", intents=intents)
 
 # Global variables to track the state of the application
 current_checkin_view = None
@@ -80,6 +88,13 @@ async def on_ready():
         logger.error(f"Error syncing commands: {e}")
 
 
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    """Handler for member changes; forgets cached admin checks when roles change."""
+    if before.roles != after.roles:
+        helpers.invalidate_admin_cache(after.guild.id, after.id)
+
+
 # ========== Register Commands ==========
 
 # Set up admin commands
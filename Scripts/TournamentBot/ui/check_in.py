@@ -6,20 +6,13 @@ for checking in, leaving, volunteering, and starting/canceling games.
 """
 import discord
 import random
-import os
 from typing import List, Dict, Any, Optional, Tuple, Union
-import sys
-
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from local package using relative paths
 from ..utils import helpers
 from ..game.game_state import GlobalGameState
 
-# Import from parent directory
+# Import from the Scripts directory (main.py puts it on sys.path)
 import databaseManager
 import Matchmaking
 
@@ -36,11 +29,34 @@ class StartGameView(discord.ui.View):
         super().__init__(timeout=None)
         self.creator_id = creator_id
         self.checked_in_users = []
+        self.checked_in_ids = set()  # String IDs of checked_in_users, for O(1) membership checks
         self.volunteers = []  # Track users who volunteer to be removed first
+        self.volunteer_ids = set()  # String IDs of volunteers, kept in sync like checked_in_ids
         self.check_in_started = True
         self.channel = None  # Store the channel where check-in is happening
         self.message_id = None  # Store the message ID of the check-in message
         self.auto_recheckin = False  # Flag to indicate if this view was auto-created by Next Game
+        self._last_embed_hash = None  # Hash of the last player list rendered to the check-in message
+    
+    def add_checked_in_user(self, user) -> None:
+        """
+        Add a user to the checked-in list.
+        
+        Args:
+            user: Discord member or DummyMember to add
+        """
+        self.checked_in_users.append(user)
+        self.checked_in_ids.add(str(user.id))
+    
+    def set_checked_in_users(self, users: list) -> None:
+        """
+        Replace the checked-in list.
+        
+        Args:
+            users: Discord members or DummyMembers to check in
+        """
+        self.checked_in_users = list(users)
+        self.checked_in_ids = {str(user.id) for user in self.checked_in_users}
 
     @discord.ui.button(label="Check In", style=discord.ButtonStyle.green)
     async def check_in_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -51,23 +67,10 @@ class StartGameView(discord.ui.View):
             interaction: Discord interaction
             button: The check-in button
         """
-        # Check for duplicate check-ins, adapted to work with both real Discord users and dummy members
+        # Check for duplicate check-ins; IDs are stored as strings for both real and dummy members
         user_id = str(interaction.user.id)
-        is_duplicate = False
-        
-        for user in self.checked_in_users:
-            # Handle both real Discord users and dummy members which might have different properties
-            existing_id = getattr(user, 'id', None)
-            if existing_id is None:
-                # For dummy members, might be stored as attribute
-                existing_id = getattr(user, 'discord_id', None)
-            
-            # Convert to string for comparison to be safe
-            if str(existing_id) == user_id:
-                is_duplicate = True
-                break
         
-        if is_duplicate:
+        if user_id in self.checked_in_ids:
             await interaction.response.send_message("You've already checked in!", ephemeral=True)
             return
         
@@ -107,7 +110,7 @@ class StartGameView(discord.ui.View):
             str(interaction.user.id), player_info.player_riot_id
         )
         
-        self.checked_in_users.append(interaction.user)
+        self.add_checked_in_user(interaction.user)
         await self.update_embed(interaction)
         
         # Construct the response message based on whether rank changed
@@ -128,40 +131,20 @@ class StartGameView(discord.ui.View):
             interaction: Discord interaction
             button: The leave button
         """
-        # Check if user is in the checked-in list using the same robust ID comparison
+        # Check if user is in the checked-in list
         user_id = str(interaction.user.id)
-        is_checked_in = False
-        user_index = -1
-        
-        for idx, user in enumerate(self.checked_in_users):
-            # Handle both real Discord users and dummy members
-            existing_id = getattr(user, 'id', None)
-            if existing_id is None:
-                # For dummy members, might be stored as attribute
-                existing_id = getattr(user, 'discord_id', None)
-            
-            # Convert to string for comparison to be safe
-            if str(existing_id) == user_id:
-                is_checked_in = True
-                user_index = idx
-                break
         
-        if not is_checked_in:
+        if user_id not in self.checked_in_ids:
             await interaction.response.send_message("You're not checked in!", ephemeral=True)
             return
         
         # Remove user from checked-in list
-        if user_index >= 0:
-            self.checked_in_users.pop(user_index)
-        else:
-            # Fallback to original method if index wasn't found
-            self.checked_in_users = [user for user in self.checked_in_users
-                                   if str(getattr(user, 'id', getattr(user, 'discord_id', None))) != user_id]
+        self.checked_in_users = [user for user in self.checked_in_users if str(user.id) != user_id]
+        self.checked_in_ids.discard(user_id)
         # Also remove from volunteers if they were in that list
-        # Check volunteer status using the same ID comparison logic
-        volunteer_ids = [str(getattr(v, 'id', getattr(v, 'discord_id', None))) for v in self.volunteers]
-        if user_id in volunteer_ids:
-            self.volunteers = [volunteer for volunteer in self.volunteers if volunteer.id != interaction.user.id]
+        if user_id in self.volunteer_ids:
+            self.volunteers = [volunteer for volunteer in self.volunteers if str(volunteer.id) != user_id]
+            self.volunteer_ids.discard(user_id)
         
         await self.update_embed(interaction)
         await interaction.response.send_message("You've left the check-in list.", ephemeral=True)
@@ -175,39 +158,25 @@ class StartGameView(discord.ui.View):
             interaction: Discord interaction
             button: The volunteer button
         """
-        # Check if user is checked in - use the same robust ID comparison
+        # Check if user is checked in
         user_id = str(interaction.user.id)
-        is_checked_in = False
-        user_obj = None
-        
-        for user in self.checked_in_users:
-            # Handle both real Discord users and dummy members
-            existing_id = getattr(user, 'id', None)
-            if existing_id is None:
-                # For dummy members, might be stored as attribute
-                existing_id = getattr(user, 'discord_id', None)
-            
-            # Convert to string for comparison to be safe
-            if str(existing_id) == user_id:
-                is_checked_in = True
-                user_obj = user
-                break
         
-        if not is_checked_in:
+        if user_id not in self.checked_in_ids:
             await interaction.response.send_message("You're not checked in! Please check in first.", ephemeral=True)
             return
+        user_obj = next((user for user in self.checked_in_users if str(user.id) == user_id), None)
             
-        # Check if already volunteered - use the same robust ID comparison
-        volunteer_ids = [str(getattr(v, 'id', getattr(v, 'discord_id', None))) for v in self.volunteers]
-        if user_id in volunteer_ids:
+        # Check if already volunteered
+        if user_id in self.volunteer_ids:
             # Remove from volunteers
-            self.volunteers = [volunteer for volunteer in self.volunteers
-                              if str(getattr(volunteer, 'id', getattr(volunteer, 'discord_id', None))) != user_id]
+            self.volunteers = [volunteer for volunteer in self.volunteers if str(volunteer.id) != user_id]
+            self.volunteer_ids.discard(user_id)
             await interaction.response.send_message("You are no longer volunteering to be cut first.", ephemeral=True)
         else:
             # Add to volunteers
             if user_obj:
                 self.volunteers.append(user_obj)
+                self.volunteer_ids.add(user_id)
             await interaction.response.send_message("You have volunteered to be cut first if needed.", ephemeral=True)
         
         await self.update_embed(interaction)
@@ -238,7 +207,7 @@ class StartGameView(discord.ui.View):
         # Add the list of checked-in users
         user_list = []
         for i, user in enumerate(self.checked_in_users):
-            volunteer_status = " (Volunteer)" if user in self.volunteers else ""
+            volunteer_status = " (Volunteer)" if str(user.id) in self.volunteer_ids else ""
             user_list.append(f"{i+1}. {user.mention}{volunteer_status}")
         
         if user_list:
@@ -255,19 +224,24 @@ class StartGameView(discord.ui.View):
             )
         
         embed.set_footer(text="A minimum of 10 players is required to start a game")
+        
+        # Skip the edit if the rendered player list is identical to the last one sent
+        embed_hash = hash(("\n".join(user_list), len(self.checked_in_users)))
+        if embed_hash == self._last_embed_hash:
+            return
+        self._last_embed_hash = embed_hash
         await interaction.message.edit(embed=embed)
 
     async def disable_all_buttons(self, message=None, reason="This check-in has been closed."):
         """
-        Disable all buttons and update the check-in message.
+        Remove the check-in buttons and update the check-in message.
         
         Args:
             message: The message to update (if None, will try to fetch from channel)
             reason: The reason to display for disabling
         """
-        # Disable all buttons
-        for child in self.children:
-            child.disabled = True
+        # Stop listening for clicks; the buttons are removed from the message below
+        self.stop()
         
         # If no message provided, try to fetch it
         if not message and self.channel and self.message_id:
@@ -285,7 +259,7 @@ class StartGameView(discord.ui.View):
                 embed.description = reason
                 embed.color = discord.Color.dark_gray()
                 
-                await message.edit(embed=embed, view=self)
+                await message.edit(embed=embed, view=None)
                 return True
             except Exception as e:
                 print(f"Error updating check-in message: {e}")
@@ -6,31 +6,40 @@ management, MVP voting, team swapping, and game progression.
 """
 import discord
 import asyncio
+import logging
 import random
 import os
 from typing import List, Dict, Any, Optional, Tuple, Union
-import sys
-
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from local package using relative paths
 from ..utils import helpers
 from ..game.game_state import GlobalGameState
+from ..ui.check_in import StartGameView, DummyMember
 
-# Import from parent directory
+# Import from the Scripts directory (main.py puts it on sys.path)
 import databaseManager
+import Matchmaking
+
+logger = logging.getLogger(__name__)
 
 
-# Helper function to check for duplicate players
-def is_duplicate_player(checked_in_users, user_id):
-    """Check if a user is already in the checked-in list."""
-    for user in checked_in_users:
-        if str(getattr(user, 'id', user.id)) == str(user_id):
-            return True
-    return False
+def get_view_game_state(item: discord.ui.Item) -> GlobalGameState:
+    """
+    Get the game state cached on an item's parent view.
+    
+    Falls back to the singleton lookup when the item is not attached to a view
+    that carries a game state.
+    
+    Args:
+        item: UI item whose parent view should be checked
+        
+    Returns:
+        The GlobalGameState instance for this item
+    """
+    game_state = getattr(item.view, "global_state", None)
+    if game_state is None:
+        game_state = GlobalGameState.get_instance()
+    return game_state
 
 
 # ===== Sitting Out Players UI =====
@@ -42,7 +51,7 @@ class SittingOutButton(discord.ui.Button):
         self.player_index = index
 
     async def callback(self, interaction: discord.Interaction):
-        global_game_state = GlobalGameState.get_instance()
+        global_game_state = get_view_game_state(self)
         await global_game_state.handle_selection(interaction, None, "sitting_out", self.player_index, self.label)
 
 
@@ -57,6 +66,13 @@ class SittingOutView(discord.ui.View):
             for i, player in enumerate(self.global_state.sitting_out):
                 button = SittingOutButton(player.username, i)
                 self.add_item(button)
+        
+        self.global_state.sitting_out_view = self
+    
+    def refresh_player_labels(self) -> None:
+        """Relabel the player buttons in place after a swap changed who sits out."""
+        for child in self.children:
+            child.label = self.global_state.sitting_out[child.player_index].username
 
 
 # ===== Game Player Buttons =====
@@ -71,7 +87,7 @@ class GamePlayerButton(discord.ui.Button):
         self.player_index = player_index
 
     async def callback(self, interaction: discord.Interaction):
-        global_game_state = GlobalGameState.get_instance()
+        global_game_state = get_view_game_state(self)
         await global_game_state.handle_selection(
             interaction, 
             self.game_index, 
@@ -88,29 +104,31 @@ class EndMVPVoteButton(discord.ui.Button):
     def __init__(self, game_index: int):
         super().__init__(label="End MVP Vote", style=discord.ButtonStyle.success)
         self.game_index = game_index
+        self.game_number = game_index + 1  # Shown to users as "Game N"
     
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
-        
-        if not game_state.mvp_voting_active.get(self.game_index, False):
-            await interaction.response.send_message(
-                f"No active MVP voting for Game {self.game_index+1}!",
-                ephemeral=True
-            )
-            return
+        game_state = get_view_game_state(self)
         
-        try:
-            await game_state.end_mvp_voting(interaction, self.game_index)
+        async with game_state.game_lock(self.game_index):
+            if not game_state.mvp_voting_active[self.game_index]:
+                await interaction.response.send_message(
+                    f"No active MVP voting for Game {self.game_number}!",
+                    ephemeral=True
+                )
+                return
             
-            # Update game message with final results
-            game_message = game_state.game_messages.get(self.game_index)
-            if game_message:
-                # Remove all MVP control buttons after voting ends
-                embed = game_message.embeds[0]
-                await game_message.edit(embed=embed, view=None)
-        except discord.errors.InteractionResponded:
-            # If interaction already responded, just let the end_mvp_voting handle it
-            pass
+            try:
+                await game_state.end_mvp_voting(interaction, self.game_index)
+            
+                # Update game message with final results
+                game_message = game_state.game_messages.get(self.game_index)
+                if game_message:
+                    # Remove all MVP control buttons after voting ends; the embed is left as is
+                    await game_message.edit(view=None)
+                    game_state.controls_cleared.add(self.game_index)
+            except discord.errors.InteractionResponded:
+                # If interaction already responded, just let the end_mvp_voting handle it
+                pass
 
 
 class CancelMVPVoteButton(discord.ui.Button):
@@ -118,29 +136,31 @@ class CancelMVPVoteButton(discord.ui.Button):
     def __init__(self, game_index: int):
         super().__init__(label="Cancel MVP Vote", style=discord.ButtonStyle.danger)
         self.game_index = game_index
+        self.game_number = game_index + 1  # Shown to users as "Game N"
     
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
+        game_state = get_view_game_state(self)
         
-        if not game_state.mvp_voting_active.get(self.game_index, False):
-            await interaction.response.send_message(
-                f"No active MVP voting for Game {self.game_index+1}!",
-                ephemeral=True
-            )
-            return
-        
-        try:
-            await game_state.cancel_mvp_voting(interaction, self.game_index)
+        async with game_state.game_lock(self.game_index):
+            if not game_state.mvp_voting_active[self.game_index]:
+                await interaction.response.send_message(
+                    f"No active MVP voting for Game {self.game_number}!",
+                    ephemeral=True
+                )
+                return
             
-            # Update game message with cancelled status
-            game_message = game_state.game_messages.get(self.game_index)
-            if game_message:
-                # Remove all MVP control buttons after voting is cancelled
-                embed = game_message.embeds[0]
-                await game_message.edit(embed=embed, view=None)
-        except discord.errors.InteractionResponded:
-            # If interaction already responded, just let the cancel_mvp_voting handle it
-            pass
+            try:
+                await game_state.cancel_mvp_voting(interaction, self.game_index)
+            
+                # Update game message with cancelled status
+                game_message = game_state.game_messages.get(self.game_index)
+                if game_message:
+                    # Remove all MVP control buttons after voting is cancelled; the embed is left as is
+                    await game_message.edit(view=None)
+                    game_state.controls_cleared.add(self.game_index)
+            except discord.errors.InteractionResponded:
+                # If interaction already responded, just let the cancel_mvp_voting handle it
+                pass
 
 
 class SkipMVPButton(discord.ui.Button):
@@ -148,52 +168,63 @@ class SkipMVPButton(discord.ui.Button):
     def __init__(self, game_index: int):
         super().__init__(label="Skip MVP Vote", style=discord.ButtonStyle.secondary, custom_id=f"skip_mvp_{game_index}")
         self.game_index = game_index
+        self.game_number = game_index + 1  # Shown to users as "Game N"
     
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
+        game_state = get_view_game_state(self)
         
-        # Check if MVP voting is already active or completed
-        if game_state.mvp_voting_active.get(self.game_index, False):
+        async with game_state.game_lock(self.game_index):
+            # Check if MVP voting is already active or completed
+            voting_active = game_state.mvp_voting_active[self.game_index]
+            already_resolved = self.game_index in game_state.mvp_resolved
+            if not voting_active and not already_resolved:
+                # Claim the skip so a second click can't save the match twice
+                game_state.mvp_resolved.add(self.game_index)
+        
+        if voting_active:
             await interaction.response.send_message(
-                f"MVP voting for Game {self.game_index+1} is already in progress. Please end or cancel it first.",
+                f"MVP voting for Game {self.game_number} is already in progress. Please end or cancel it first.",
                 ephemeral=True
             )
             return
-            
-        # Mark this game as not needing MVP voting
-        if self.game_index not in game_state.mvp_voting_active:
-            game_state.mvp_voting_active[self.game_index] = False
         
-        # Get the game result and update the database
+        if already_resolved:
+            await interaction.response.send_message(
+                f"MVP voting for Game {self.game_number} has already been resolved.",
+                ephemeral=True
+            )
+            return
+        
+        # Acknowledge right away; match data is saved in the background
+        await interaction.response.send_message(
+            f"MVP voting for Game {self.game_number} has been skipped. Match data is being saved.",
+            ephemeral=True
+        )
+        
+        # Get the game result and update the database with NULL MVP; this is scheduled
+        # before the message edit so a failed edit can't lose the match data
         result = game_state.game_results.get(self.game_index, None)
         if result:
-            # Store match data in database with NULL MVP
-            await databaseManager.store_match_data(game_state.games[self.game_index], result, None)
-            
-            # Update all player statistics
-            await databaseManager.update_all_player_stats(game_state.games[self.game_index], result, None)
+            game_state.run_db_task(
+                game_state.persist_match_result(self.game_index, result, None),
+                interaction
+            )
         else:
-            print(f"Error: No game result found for game {self.game_index}")
+            logger.error("No game result found for game %d", self.game_index)
         
         # Remove the MVP buttons but keep the game result
         game_message = game_state.game_messages.get(self.game_index)
         if game_message:
-            # Keep the existing embed which contains the Result field
-            embed = game_message.embeds[0]
-            # Create an empty view - this creates clean UI with no buttons
-            empty_view = discord.ui.View()
-            await game_message.edit(embed=embed, view=empty_view)
-        
-        await interaction.response.send_message(
-            f"MVP voting for Game {self.game_index+1} has been skipped. Match data has been saved.",
-            ephemeral=True
-        )
+            # Editing only the view keeps the existing embed, which contains the Result field
+            await game_message.edit(view=None)
+            game_state.controls_cleared.add(self.game_index)
 
 
 class GameMVPControlView(discord.ui.View):
     """View for controlling MVP voting for a specific game."""
-    def __init__(self, game_index: int, is_voting_active: bool = False):
+    def __init__(self, game_index: int, is_voting_active: bool = False, global_state: GlobalGameState = None):
         super().__init__(timeout=None)
+        self.global_state = global_state or GlobalGameState.get_instance()
         self.game_index = game_index
         
         if not is_voting_active:
@@ -213,37 +244,45 @@ class MVPVoteButton(discord.ui.Button):
     def __init__(self, game_index: int, blue_team=None, red_team=None):
         super().__init__(label="Vote for MVP", style=discord.ButtonStyle.secondary)
         self.game_index = game_index
+        self.game_number = game_index + 1  # Shown to users as "Game N"
         # Store teams for backward compatibility
         self.blue_team = blue_team
         self.red_team = red_team
     
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
-        
-        # Check if voting is already active for this game
-        if game_state.mvp_voting_active.get(self.game_index, False):
-            await interaction.response.send_message(
-                f"MVP voting for Game {self.game_index+1} is already active!",
-                ephemeral=True
-            )
-            return
+        game_state = get_view_game_state(self)
         
-        # Get the blue and red teams from the game state
-        game = game_state.games[self.game_index]
-        blue_team = game["blue"]
-        red_team = game["red"]
+        async with game_state.game_lock(self.game_index):
+            # Check if voting is already active for this game
+            if game_state.mvp_voting_active[self.game_index]:
+                await interaction.response.send_message(
+                    f"MVP voting for Game {self.game_number} is already active!",
+                    ephemeral=True
+                )
+                return
             
-        # Start MVP voting
-        await game_state.start_mvp_voting(interaction, self.game_index)
-        
-        # Update this game's message with new controls while preserving result
-        game_message = game_state.game_messages.get(self.game_index)
-        if game_message:
-            # Get the existing embed which may contain the result
-            embed = game_message.embeds[0]
-            # Update with End/Cancel buttons
-            mvp_control_view = GameMVPControlView(self.game_index, True)
-            await game_message.edit(embed=embed, view=mvp_control_view)
+            # A stale click can arrive after the MVP step was skipped or finished
+            if self.game_index in game_state.mvp_resolved:
+                await interaction.response.send_message(
+                    f"MVP voting for Game {self.game_number} has already been resolved.",
+                    ephemeral=True
+                )
+                return
+            
+            # Get the blue and red teams from the game state
+            game = game_state.games[self.game_index]
+            blue_team = game["blue"]
+            red_team = game["red"]
+                
+            # Start MVP voting
+            await game_state.start_mvp_voting(interaction, self.game_index)
+            
+            # Update this game's message with new controls while preserving result
+            game_message = game_state.game_messages.get(self.game_index)
+            if game_message:
+                # Update with End/Cancel buttons; the embed with the result is left as is
+                mvp_control_view = GameMVPControlView(self.game_index, True, game_state)
+                await game_message.edit(view=mvp_control_view)
         
         # Just defer the interaction - no confirmation message needed
         try:
@@ -253,100 +292,77 @@ class MVPVoteButton(discord.ui.Button):
             pass
 
 
-class BlueWinButton(discord.ui.Button):
-    """Button to declare Blue team as the winner."""
-    def __init__(self, game_index: int, blue_team: list, red_team: list):
-        super().__init__(label="Blue Team Win", style=discord.ButtonStyle.primary)
+class WinButton(discord.ui.Button):
+    """Button to declare a team as the winner of a game."""
+    # Label, button style and result text for each team
+    TEAM_DISPLAY = {
+        "blue": ("Blue Team Win", discord.ButtonStyle.primary, "🟦 Blue Team Wins!"),
+        "red": ("Red Team Win", discord.ButtonStyle.danger, "🟥 Red Team Wins!"),
+    }
+
+    def __init__(self, game_index: int, winner: str):
+        label, style, result_text = self.TEAM_DISPLAY[winner]
+        super().__init__(label=label, style=style)
         self.game_index = game_index
-        self.blue_team = blue_team
-        self.red_team = red_team
+        self.game_number = game_index + 1  # Shown to users as "Game N"
+        self.winner = winner
+        self.loser = "red" if winner == "blue" else "blue"
+        self.result_text = result_text
 
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
+        game_state = get_view_game_state(self)
         
-        embed = interaction.message.embeds[0]
-        embed.add_field(name="Result", value="🟦 Blue Team Wins!", inline=False)
-        
-        # Store the game result for later database update
-        game_state.game_results[self.game_index] = "blue"
-        game_state.games[self.game_index]["result"] = "blue"
-            
-        # Create a new view with MVP controls directly under this game
-        mvp_control_view = GameMVPControlView(self.game_index, False)
-        
-        # Update the message with the new view while preserving the result
-        await interaction.message.edit(embed=embed, view=mvp_control_view)
-        # Store the message reference for future updates
-        game_state.game_messages[self.game_index] = interaction.message
-        game_state.message_references[f"game_control_{self.game_index}"] = interaction.message
-        game_state.game_messages[self.game_index] = interaction.message
-        
-        # Update database with win data
-        try:
-            # Update winner stats
-            winners = self.blue_team
-            await databaseManager.update_wins(winners)
-            
-            # Update loser stats (only games played since winners get that in update_wins)
-            for player in self.red_team:
-                await databaseManager.update_games_played(player.discord_id)
-        except Exception as e:
-            print(f"Error updating database: {e}")
-        
-        # Just defer instead of sending a confirmation message
+        # Acknowledge first so the message edit below can't run past the response deadline
         try:
             await interaction.response.defer()
         except (discord.errors.NotFound, discord.errors.InteractionResponded):
             # Interaction may have timed out or already been responded to
             pass
-
-
-class RedWinButton(discord.ui.Button):
-    """Button to declare Red team as the winner."""
-    def __init__(self, game_index: int, blue_team: list, red_team: list):
-        super().__init__(label="Red Team Win", style=discord.ButtonStyle.danger)
-        self.game_index = game_index
-        self.blue_team = blue_team
-        self.red_team = red_team
-
-    async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
-        
-        embed = interaction.message.embeds[0]
-        embed.add_field(name="Result", value="🟥 Red Team Wins!", inline=False)
         
-        # Store the game result for later database update
-        game_state.game_results[self.game_index] = "red"
-        game_state.games[self.game_index]["result"] = "red"
+        async with game_state.game_lock(self.game_index):
+            # A concurrent click on the other team's button may have won the race
+            if self.game_index in game_state.game_results:
+                await interaction.followup.send(
+                    f"Game {self.game_number} already has a result.",
+                    ephemeral=True
+                )
+                return
             
-        # Create a new view with MVP controls directly under this game
-        mvp_control_view = GameMVPControlView(self.game_index, False)
-        
-        # Update the message with the new view while preserving the result
-        await interaction.message.edit(embed=embed, view=mvp_control_view)
-        # Store the message reference for future updates
-        game_state.game_messages[self.game_index] = interaction.message
-        game_state.message_references[f"game_control_{self.game_index}"] = interaction.message
-        game_state.game_messages[self.game_index] = interaction.message
-        
-        # Update database with win data
-        try:
-            # Update winner stats
-            winners = self.red_team
-            await databaseManager.update_wins(winners)
+            message = interaction.message
+            embed = message.embeds[0]
+            embed.add_field(name="Result", value=self.result_text, inline=False)
             
-            # Update loser stats (only games played since winners get that in update_wins)
-            for player in self.blue_team:
-                await databaseManager.update_games_played(player.discord_id)
-        except Exception as e:
-            print(f"Error updating database: {e}")
-        
-        # Just defer instead of sending a confirmation message
-        try:
-            await interaction.response.defer()
-        except (discord.errors.NotFound, discord.errors.InteractionResponded):
-            # Interaction may have timed out or already been responded to
-            pass
+            # Store the game result for later database update
+            game_state.record_result(self.game_index, self.winner)
+            
+            # Update database with win data in the background; this is scheduled
+            # before the message edit so a failed edit can't lose the win
+            game = game_state.games[self.game_index]
+            game_state.run_db_task(
+                game_state.persist_win(game[f"{self.winner}_ids"], game[f"{self.loser}_ids"]),
+                interaction
+            )
+                
+            # Create a new view with MVP controls directly under this game
+            mvp_control_view = GameMVPControlView(self.game_index, False, game_state)
+            
+            # Update the message with the new view while preserving the result
+            await message.edit(embed=embed, view=mvp_control_view)
+        # Store the message reference for future updates
+        game_state.game_messages[self.game_index] = message
+        game_state.message_references[f"game_control_{self.game_index}"] = message
+
+
+class BlueWinButton(WinButton):
+    """Button to declare Blue team as the winner."""
+    def __init__(self, game_index: int):
+        super().__init__(game_index, "blue")
+
+
+class RedWinButton(WinButton):
+    """Button to declare Red team as the winner."""
+    def __init__(self, game_index: int):
+        super().__init__(game_index, "red")
 
 
 class GameControlView(discord.ui.View):
@@ -355,35 +371,50 @@ class GameControlView(discord.ui.View):
         super().__init__(timeout=None)
         self.global_state = global_state
         self.game_index = game_index
+        game = self.global_state.games[game_index]
+        blue_team = game["blue"]
+        red_team = game["red"]
         
-        # Add player buttons for swap mode
+        # Add player buttons for swap mode (blue on row 0, red on row 1)
         if not self.global_state.finalized and self.global_state.swap_mode:
-            blue_team = self.global_state.games[game_index]["blue"]
-            for i, player in enumerate(blue_team):
-                button = GamePlayerButton(game_index, "blue", i, player.username)
-                button.row = 0
-                self.add_item(button)
-            
-            red_team = self.global_state.games[game_index]["red"]
-            for i, player in enumerate(red_team):
-                button = GamePlayerButton(game_index, "red", i, player.username)
-                button.row = 1
-                self.add_item(button)
+            for row, (team, players) in enumerate((("blue", blue_team), ("red", red_team))):
+                for i, player in enumerate(players):
+                    button = GamePlayerButton(game_index, team, i, player.username)
+                    button.row = row
+                    self.add_item(button)
         
         # Add win declaration buttons when games are finalized
         if self.global_state.finalized:
-            blue_team = self.global_state.games[self.game_index]["blue"]
-            red_team = self.global_state.games[self.game_index]["red"]
-            
             # Only add buttons if no result is recorded yet
-            if not self.global_state.games[self.game_index].get("result"):
-                blue_win = BlueWinButton(self.game_index, blue_team, red_team)
+            if not game.get("result"):
+                blue_win = BlueWinButton(self.game_index)
                 blue_win.row = 2
                 self.add_item(blue_win)
                 
-                red_win = RedWinButton(self.game_index, blue_team, red_team)
+                red_win = RedWinButton(self.game_index)
                 red_win.row = 2
                 self.add_item(red_win)
+        
+        self.layout = self._current_layout()
+        self.global_state.game_views[game_index] = self
+    
+    def _current_layout(self) -> tuple:
+        """Return which button groups this game's view should show right now."""
+        game_state = self.global_state
+        show_players = not game_state.finalized and game_state.swap_mode
+        show_win_buttons = game_state.finalized and not game_state.games[self.game_index].get("result")
+        return (show_players, show_win_buttons)
+    
+    def is_current(self) -> bool:
+        """Check whether this view's buttons still match the game's phase."""
+        return self.layout == self._current_layout()
+    
+    def refresh_player_labels(self) -> None:
+        """Relabel the player buttons in place after a swap changed the rosters."""
+        game = self.global_state.games[self.game_index]
+        for child in self.children:
+            if isinstance(child, GamePlayerButton):
+                child.label = game[child.team][child.player_index].username
 
 class MVPVotingView(discord.ui.View):
     """View for players to cast their MVP votes."""
@@ -414,24 +445,18 @@ class PlayerMVPButton(discord.ui.Button):
             row=row
         )
         self.game_index = game_index
+        self.game_number = game_index + 1  # Shown to users as "Game N"
         self.player = player
         self.winning_team = winning_team
     
     async def callback(self, interaction: discord.Interaction):
-        game_state = GlobalGameState.get_instance()
+        game_state = get_view_game_state(self)
         
         # Verify voter is on the winning team
         voter_id = str(interaction.user.id)
         game = game_state.games[self.game_index]
-        winning_team_players = game[self.winning_team]
-        
-        voter_on_winning_team = False
-        for player in winning_team_players:
-            if player.discord_id == voter_id:
-                voter_on_winning_team = True
-                break
         
-        if not voter_on_winning_team:
+        if voter_id not in game[f"{self.winning_team}_ids"]:
             await interaction.response.send_message(
                 f"Only members of the winning {self.winning_team.capitalize()} team can vote for MVP.",
                 ephemeral=True
@@ -446,21 +471,27 @@ class PlayerMVPButton(discord.ui.Button):
             )
             return
         
-        # Register vote
-        if self.game_index not in game_state.mvp_votes:
-            game_state.mvp_votes[self.game_index] = {}
+        async with game_state.game_lock(self.game_index):
+            voting_active = game_state.mvp_voting_active[self.game_index]
+            if voting_active:
+                # Register vote, remembering any earlier choice
+                votes = game_state.mvp_votes[self.game_index]
+                previous_vote = votes.get(voter_id)
+                votes[voter_id] = self.player.discord_id
+        
+        if not voting_active:
+            await interaction.response.send_message(
+                f"MVP voting for Game {self.game_number} has ended.",
+                ephemeral=True
+            )
+            return
         
         # Check if already voted
-        if voter_id in game_state.mvp_votes[self.game_index]:
-            previous_vote = game_state.mvp_votes[self.game_index][voter_id]
-            previous_player = None
-            for p in winning_team_players:
-                if p.discord_id == previous_vote:
-                    previous_player = p
-                    break
+        if previous_vote is not None:
+            previous_name = game["id_to_name"].get(previous_vote, "someone else")
             
             await interaction.response.send_message(
-                f"You've changed your vote from {previous_player.username if previous_player else 'someone else'} to {self.player.username}.",
+                f"You've changed your vote from {previous_name} to {self.player.username}.",
                 ephemeral=True
             )
         else:
@@ -468,61 +499,9 @@ class PlayerMVPButton(discord.ui.Button):
                 f"You've voted for {self.player.username} as MVP!",
                 ephemeral=True
             )
-        
-        # Store the vote
-        game_state.mvp_votes[self.game_index][voter_id] = self.player.discord_id
         # Admin tracking functionality removed
 
 
-class ConfirmNextGameView(discord.ui.View):
-    """Confirmation view for skipping active MVP voting."""
-    def __init__(self, global_control_view):
-        super().__init__(timeout=None)
-        self.global_control_view = global_control_view
-    
-    @discord.ui.button(label="Yes, Skip Voting", style=discord.ButtonStyle.danger)
-    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        game_state = GlobalGameState.get_instance()
-        
-        # Cancel all active MVP votes in any game
-        for game_index, is_active in list(game_state.mvp_voting_active.items()):
-            if is_active:
-                await game_state.cancel_mvp_voting(
-                    interaction,
-                    game_index,
-                    silent=True
-                )
-        
-        # Fade out all game controls
-        await self.global_control_view.fade_all_game_controls()
-        
-        # Fade out the buttons on the global controls message
-        if game_state.global_controls_message:
-            gc_embed = discord.Embed(
-                title="Global Controls (Preparing New Game)",
-                description="MVP voting has been skipped. Preparing for the next game.",
-                color=discord.Color.dark_gold()
-            )
-            # Disable all buttons to create a fade effect
-            disabled_view = GlobalControlView()
-            for child in disabled_view.children:
-                child.disabled = True
-            await game_state.global_controls_message.edit(embed=gc_embed, view=disabled_view)
-        
-        await interaction.response.send_message(
-            "Preparing for the next game. Use /checkin to start a new check-in session.",
-            ephemeral=True
-        )
-        
-        # Delete the confirmation message
-        await interaction.message.delete()
-    
-    @discord.ui.button(label="No, Keep Voting", style=discord.ButtonStyle.secondary)
-    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_message("Continuing with MVP voting.", ephemeral=True)
-        await interaction.message.delete()
-
-
 class GlobalPhasedControlView:
     """Factory for creating the appropriate phase view for global controls."""
     @staticmethod
@@ -566,43 +545,30 @@ class GlobalPhase1View(discord.ui.View):
     
     async def start_game_callback(self, interaction: discord.Interaction):
         """Create the games and transition to Phase 2 (Swap and Finalize Games)."""
-        # Import needed modules
+        # Imported here to avoid a circular import with the bot entry point
         import Scripts.TournamentBot.main as main_module
-        import Matchmaking
-        import random
-        from ..game.game_state import GlobalGameState
         
         await interaction.response.defer(ephemeral=True)
         
         # Check if there's an active check-in
         if not main_module.current_checkin_view:
-            # Try direct import as a fallback
-            import Scripts.TournamentBot.main as main_module_direct
-            if main_module_direct.current_checkin_view:
-                # Use the direct reference instead
-                print(f"Found check-in view via direct import: {id(main_module_direct.current_checkin_view)}")
-                main_module.current_checkin_view = main_module_direct.current_checkin_view
-            else:
-                print(f"ERROR: No active check-in session found. current_checkin_view is None")
-                print(f"Module loaded as: {main_module.__name__}")
-                await interaction.followup.send(
-                    "Error: No active check-in session found. Please create a new check-in first.",
-                    ephemeral=True
-                )
-                return
+            logger.error("No active check-in session found; current_checkin_view is None")
+            await interaction.followup.send(
+                "Error: No active check-in session found. Please create a new check-in first.",
+                ephemeral=True
+            )
+            return
             
         # If we get here, we have an active check-in
-        print(f"Found active check-in: {id(main_module.current_checkin_view)}")
+        logger.debug("Found active check-in: %s", id(main_module.current_checkin_view))
             
         # Get the current checkin view
         view = main_module.current_checkin_view
         
-        # Build a list of Player objects from the check-in list
-        players = []
-        for user in view.checked_in_users:
-            player_obj = await databaseManager.get_player_info(str(user.id))
-            if player_obj is not None:
-                players.append(player_obj)
+        # Build a list of Player objects from the check-in list, in check-in order
+        checked_in_ids = [str(user.id) for user in view.checked_in_users]
+        players_info = await databaseManager.get_players_info_bulk(checked_in_ids)
+        players = [players_info[discord_id] for discord_id in checked_in_ids if discord_id in players_info]
 
         if not players:
             await interaction.followup.send("No valid players found in the check-in list!", ephemeral=True)
@@ -619,25 +585,22 @@ class GlobalPhase1View(discord.ui.View):
         await view.disable_all_buttons(reason="This check-in has been closed. Games are being created.")
 
         # Get list of volunteers who are playing (they have player objects)
-        volunteer_players = []
-        for volunteer in view.volunteers:
-            for player in players:
-                if str(volunteer.id) == player.discord_id:
-                    volunteer_players.append(player)
-                    break
-        
-        # Remove players until count is a multiple of 10, prioritizing volunteers
-        cut_players = []
-        while len(players) % 10 != 0:
-            if volunteer_players:
-                # Remove a volunteer first if available
-                removed = volunteer_players.pop(0)
-            else:
-                # Otherwise remove a random player
-                removed = random.choice(players)
-            
-            players.remove(removed)
-            cut_players.append(removed)
+        players_by_id = {player.discord_id: player for player in players}
+        volunteer_players = [players_by_id[str(volunteer.id)] for volunteer in view.volunteers
+                             if str(volunteer.id) in players_by_id]
+        
+        # Cut players until count is a multiple of 10, prioritizing volunteers
+        num_to_cut = len(players) % 10
+        cut_players = volunteer_players[:num_to_cut]
+        cut_ids = {player.discord_id for player in cut_players}
+        if len(cut_players) < num_to_cut:
+            # Fill the remaining cuts with a random sample of everyone else
+            candidates = [player for player in players if player.discord_id not in cut_ids]
+            random_cuts = random.sample(candidates, num_to_cut - len(cut_players))
+            cut_players.extend(random_cuts)
+            cut_ids.update(player.discord_id for player in random_cuts)
+        
+        players = [player for player in players if player.discord_id not in cut_ids]
         
         # Use the matchmaking algorithm to create teams
         blue_teams, red_teams = Matchmaking.matchmaking_multiple(players)
@@ -651,40 +614,36 @@ class GlobalPhase1View(discord.ui.View):
         # Get a new game state instance
         game_state = GlobalGameState.get_instance()
         
-        # Initialize the game state with teams and sitting-out players
-        public_channel = None
-        for guild in interaction.client.guilds:
-            for channel in guild.channels:
-                if hasattr(view, 'channel') and view.channel and channel.id == view.channel.id:
-                    public_channel = channel
-                    break
+        # Initialize the game state with teams and sitting-out players.
+        # The check-in view already holds the channel it was posted in.
+        public_channel = view.channel
         
         await game_state.initialize_games(games, cut_players, public_channel)
         game_state.admin_channel = interaction.channel
         
-        # Create game control messages for each game
-        from ..ui.game_control import GameControlView
-        
         # Clear any existing messages
         game_state.message_references = {}
         game_state.game_messages = {}
         
-        # Send game control messages to admin channel
-        for i in range(len(games)):
-            embed = game_state.generate_embed(i)
-            view = GameControlView(game_state, i)
-            message = await interaction.channel.send(embed=embed, view=view)
+        # Build every game's embed and controls before touching the network
+        game_payloads = [
+            (game_state.generate_embed(i), game_state.get_or_build_game_view(i))
+            for i in range(len(games))
+        ]
+        
+        # Send game control messages to the admin channel one at a time so they
+        # read Game 1..N top to bottom; concurrent sends can land out of order
+        for i, (embed, game_view) in enumerate(game_payloads):
+            message = await interaction.channel.send(embed=embed, view=game_view)
             game_state.message_references[f"game_control_{i}"] = message
             game_state.game_messages[i] = message
         
         # Send sitting out message
         if cut_players:
-            from ..ui.game_control import SittingOutView
-            
             embed = game_state.generate_sitting_out_embed()
             # Only create view if swap mode is enabled and games aren't finalized
             if game_state.swap_mode and not game_state.finalized:
-                view = SittingOutView(game_state)
+                view = game_state.get_or_build_sitting_out_view()
                 message = await interaction.channel.send(embed=embed, view=view)
             else:
                 # Initially send with no buttons since swap mode is disabled by default
@@ -700,7 +659,7 @@ class GlobalPhase1View(discord.ui.View):
         gc_embed = discord.Embed(
             title="Global Controls (Team Balancing)",
             description="Use swap mode to balance teams, then finalize to start the games",
-            color=discord.Color.blue()
+            color=helpers.COLOR_BLUE
         )
         
         # Update the message with the new view
@@ -720,6 +679,9 @@ class GlobalPhase1View(discord.ui.View):
         # Import needed module
         import Scripts.TournamentBot.main as main_module
         
+        # Acknowledge first; closing the check-in message below takes extra requests
+        await interaction.response.defer()
+        
         # Reset the game state
         GlobalGameState.reset_instance()
         
@@ -737,16 +699,14 @@ class GlobalPhase1View(discord.ui.View):
         gc_embed = discord.Embed(
             title="Global Controls (Game Cancelled)",
             description="The game session has been cancelled.",
-            color=discord.Color.dark_red()
+            color=helpers.COLOR_DARK_RED
         )
         
-        # Create empty view
-        empty_view = discord.ui.View()
-        
-        # Update the message
-        await interaction.message.edit(embed=gc_embed, view=empty_view)
+        # Stop listening for clicks and remove the buttons
+        self.stop()
+        await interaction.message.edit(embed=gc_embed, view=None)
         
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "Game session cancelled. You can use /checkin to start a new session.",
             ephemeral=True
         )
@@ -764,6 +724,13 @@ class GlobalPhase2View(discord.ui.View):
             await interaction.response.send_message("No game in progress.", ephemeral=True)
             return
         
+        # Acknowledge first; toggling swap mode re-renders every game message
+        try:
+            await interaction.response.defer()
+        except (discord.errors.NotFound, discord.errors.InteractionResponded):
+            # Interaction may have timed out or already been responded to
+            pass
+        
         await self.global_state.toggle_swap_mode(interaction)
         button.label = "Stop Swapping" if self.global_state.swap_mode else "Swap"
         await interaction.message.edit(view=self)
@@ -771,41 +738,45 @@ class GlobalPhase2View(discord.ui.View):
     @discord.ui.button(label="Finalize Games", style=discord.ButtonStyle.primary, row=0)
     async def finalize_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Finalize games and enable win declaration."""
+        # Acknowledge first; finalizing edits and posts a message per game
+        try:
+            await interaction.response.defer()
+        except (discord.errors.NotFound, discord.errors.InteractionResponded):
+            # Interaction may have timed out or already been responded to
+            pass
+        
         self.global_state.finalized = True
         
         # Update participation points for sitting-out players
         if self.global_state.sitting_out:
-            sit_out_log = ["Updating participation for sitting-out players:"]
-            for player in self.global_state.sitting_out:
-                try:
-                    # Award participation points to sitting-out player
-                    result = await databaseManager.update_points(player.discord_id)
-                    sit_out_log.append(result)
-                except Exception as e:
-                    error_msg = f"Error updating points for {player.username} ({player.discord_id}): {str(e)}"
-                    sit_out_log.append(error_msg)
-                    print(error_msg)  # Log error for debugging
-            
-            # Print results for server-side logging
-            print("\n".join(sit_out_log))
+            try:
+                # Award participation points to every sitting-out player in one transaction
+                results = await databaseManager.update_points_bulk(
+                    [player.discord_id for player in self.global_state.sitting_out]
+                )
+                logger.debug("Updated participation for sitting-out players:\n%s", "\n".join(results))
+            except Exception:
+                logger.exception("Error updating points for sitting-out players")
                     # Send individual game embeds to the public channel
         
-        # Update all game messages with win buttons
-        await self.global_state.update_all_messages()
-
-        # Send Finalized Games to the public channel
-        if self.global_state.public_channel:
-            for i in range(len(self.global_state.games)):
-                embed = self.global_state.generate_embed(i)
-                await self.global_state.public_channel.send(embed=embed)
-        else:
-            print("Warning: public_channel is None, cannot send game embeds to public channel")
+        async def send_public_games():
+            """Send Finalized Games to the public channel, in game order."""
+            if self.global_state.public_channel:
+                embeds = [self.global_state.generate_embed(i) for i in range(len(self.global_state.games))]
+                # Concurrent sends to one channel can land out of order, so post one at a time
+                for embed in embeds:
+                    await self.global_state.public_channel.send(embed=embed)
+            else:
+                logger.warning("public_channel is None, cannot send game embeds to public channel")
+        
+        # Update all game messages with win buttons while the public posts go out
+        await asyncio.gather(self.global_state.update_all_messages(), send_public_games())
 
         # Transition to Phase 3 (Next Game / Cancel Games)
         gc_embed = discord.Embed(
             title="Global Controls (Game Results)",
             description="Games have been finalized. Select winners for each game, conduct MVP voting, then use Next Game when finished.",
-            color=discord.Color.gold()
+            color=helpers.COLOR_GOLD
         )
         
         # Create Phase 3 view
@@ -813,13 +784,6 @@ class GlobalPhase2View(discord.ui.View):
         
         # Update the message with the new view
         await interaction.message.edit(embed=gc_embed, view=phase3_view)
-        
-        # Just defer instead of sending a confirmation message
-        try:
-            await interaction.response.defer()
-        except (discord.errors.NotFound, discord.errors.InteractionResponded):
-            # Interaction may have timed out or already been responded to
-            pass
 
 class GlobalPhase3View(discord.ui.View):
     """Phase 3 global controls (Next Game / Cancel Games)."""
@@ -849,70 +813,41 @@ class GlobalPhase3View(discord.ui.View):
         """Disable all interactive buttons in game messages to create a fade effect."""
         game_state = GlobalGameState.get_instance()
         
-        # Create empty views to replace the functional ones
+        # Replace the functional views with empty ones, all games at once
+        edits = []
         for i in range(len(game_state.games)):
             key = f"game_control_{i}"
-            if key in game_state.message_references:
+            # Skip games whose buttons were already removed after MVP voting
+            if key in game_state.message_references and i not in game_state.controls_cleared:
                 message = game_state.message_references[key]
-                try:
-                    # Create a completely empty view instead of using game control buttons
-                    empty_view = discord.ui.View()
-                    
-                    # Update the message with no functional buttons
-                    await message.edit(view=empty_view)
-                except Exception as e:
-                    print(f"Failed to disable controls for Game {i+1}: {e}")
+                # Strip the components entirely; no throwaway empty view is needed
+                edits.append((f"disable controls for Game {i+1}", message.edit(view=None)))
         
-        # Disable sitting out controls if they exist
-        if game_state.sitting_out_message:
-            try:
-                # Create a disabled sitting out view
-                if game_state.swap_mode:
-                    disabled_view = SittingOutView(game_state)
-                    for child in disabled_view.children:
-                        child.disabled = True
-                    await game_state.sitting_out_message.edit(view=disabled_view)
-                    
-            except Exception as e:
-                print(f"Failed to disable sitting out controls: {e}")
+        # Remove sitting out controls if they exist
+        if game_state.sitting_out_message and game_state.swap_mode:
+            if game_state.sitting_out_view is not None:
+                game_state.sitting_out_view.stop()
+            edits.append(("disable sitting out controls", game_state.sitting_out_message.edit(view=None)))
+        
+        await game_state.run_message_edits(edits)
                 
         # MVP admin message controls removed as part of simplification
     
     async def next_game_callback(self, interaction: discord.Interaction):
         """Proceed to next game setup with auto re-check-in."""
+        # Imported here to avoid a circular import with the bot entry point
+        import Scripts.TournamentBot.main as main_module
+        
         game_state = GlobalGameState.get_instance()
         
         # Debug print to see the current state
-        print(f"Next Game clicked - Games: {len(game_state.games)}, Messages: {len(game_state.game_messages)}")
+        logger.debug("Next Game clicked - Games: %d, Messages: %d", len(game_state.games), len(game_state.game_messages))
         
         # First acknowledge the interaction to avoid timeout errors
         try:
             await interaction.response.defer(ephemeral=True)
         except Exception as e:
-            print(f"Error deferring interaction: {e}")
-        
-        # Define helper functions to check game state correctly
-        def has_result(game_index):
-            """Check if a game has a winner declared."""
-            # Check both message_references and game_messages for backward compatibility
-            game_message = None
-            key = f"game_control_{game_index}"
-            if key in game_state.message_references:
-                game_message = game_state.message_references[key]
-            elif game_index in game_state.game_messages:
-                game_message = game_state.game_messages[game_index]
-                
-            if not game_message:
-                return False
-                
-            return any(field.name == "Result" for field in game_message.embeds[0].fields)
-            
-        def is_mvp_resolved(game_index):
-            """Check if MVP voting has been resolved (either completed or skipped)."""
-            if game_index not in game_state.mvp_voting_active:
-                return False  # Not addressed at all
-                
-            return game_state.mvp_voting_active[game_index] == False  # Explicitly completed or skipped
+            logger.warning("Error deferring interaction: %s", e)
         
         # Get list of games that have messages
         games_with_messages = [idx for idx in range(len(game_state.games))
@@ -924,67 +859,69 @@ class GlobalPhase3View(discord.ui.View):
                 ephemeral=True
             )
             return
-            
-        # STEP 1: Check if all games have a winner declared
-        games_without_result = [idx for idx in games_with_messages if not has_result(idx)]
-        
-        if games_without_result:
-            game_numbers = ", ".join([f"Game {i+1}" for i in games_without_result])
-            await interaction.followup.send(
-                f"No victor has been decided for {game_numbers}. Cannot proceed to the next game.",
-                ephemeral=True
-            )
-            print(f"Next Game blocked: Games {games_without_result} missing results")
-            return
-        
-        # STEP 2: Check if all games with results have MVP voting addressed
-        games_with_pending_mvp = [idx for idx in games_with_messages
-                                 if has_result(idx) and not is_mvp_resolved(idx)]
         
-        if games_with_pending_mvp:
-            game_numbers = ", ".join([f"Game {i+1}" for i in games_with_pending_mvp])
-            await interaction.followup.send(
-                f"MVP Vote needs to be concluded with an MVP or needs to be explicitly skipped for {game_numbers}.",
-                ephemeral=True
-            )
-            print(f"Next Game blocked: Games {games_with_pending_mvp} have pending MVP voting")
-            return
+        # Only scan individual games when the counters say something is unresolved
+        if not game_state.all_games_resolved():
+            # Sort games into missing a winner / MVP voting still open in one pass.
+            # record_result stores every declared winner, so no need to inspect message embeds
+            games_without_result = []
+            games_with_pending_mvp = []
+            for idx in games_with_messages:
+                if idx not in game_state.game_results:
+                    games_without_result.append(idx)
+                elif game_state.mvp_voting_active[idx]:
+                    games_with_pending_mvp.append(idx)
+            
+            # STEP 1: Check if all games have a winner declared
+            if games_without_result:
+                game_numbers = ", ".join([f"Game {i+1}" for i in games_without_result])
+                await interaction.followup.send(
+                    f"No victor has been decided for {game_numbers}. Cannot proceed to the next game.",
+                    ephemeral=True
+                )
+                logger.info("Next Game blocked: Games %s missing results", games_without_result)
+                return
+            
+            # STEP 2: Check if all games with results have MVP voting addressed
+            if games_with_pending_mvp:
+                game_numbers = ", ".join([f"Game {i+1}" for i in games_with_pending_mvp])
+                await interaction.followup.send(
+                    f"MVP Vote needs to be concluded with an MVP or needs to be explicitly skipped for {game_numbers}.",
+                    ephemeral=True
+                )
+                logger.info("Next Game blocked: Games %s have pending MVP voting", games_with_pending_mvp)
+                return
         
         # All conditions met, proceed with next game
         
-        # Update the global controls to show processing state
+        # Stop listening for clicks so Next Game can't run twice, and show a processing
+        # state until the outcome below replaces it
+        self.stop()
         gc_embed = discord.Embed(
             title="Global Controls (Processing...)",
             description="Starting new game session...",
-            color=discord.Color.dark_gold()
+            color=helpers.COLOR_DARK_GOLD
         )
-        
-        # Create disabled view
-        disabled_view = GlobalPhase3View(self.global_state)
-        for child in disabled_view.children:
-            child.disabled = True
-        
-        # Edit the message immediately to show processing state
         try:
-            await interaction.message.edit(embed=gc_embed, view=disabled_view)
+            await interaction.message.edit(embed=gc_embed, view=None)
         except Exception as e:
-            print(f"Error updating global controls: {e}")
+            logger.warning("Error updating global controls: %s", e)
             
         # Disable all other game controls
         await self.fade_all_game_controls()
         
         # Create a new check-in session
-        previous_players = []
+        checkin_created = False
+        previous_players = {}  # Discord ID -> username, in session order
         try:
             if game_state and game_state.public_channel:
-                # Get all unique players from all games
+                # Get all unique players from the per-game ID lookups
                 for game in game_state.games:
-                    previous_players.extend(game["blue"])
-                    previous_players.extend(game["red"])
+                    previous_players.update(game["id_to_name"])
                 
                 # Add sitting out players
-                if game_state.sitting_out:
-                    previous_players.extend(game_state.sitting_out)
+                for player in game_state.sitting_out:
+                    previous_players.setdefault(player.discord_id, player.username)
                 
                 # Get the public channel for re-check-in
                 public_channel = game_state.public_channel
@@ -995,17 +932,13 @@ class GlobalPhase3View(discord.ui.View):
                 # Reset the game state for a new session
                 GlobalGameState.reset_instance()
                 
-                # Import needed modules
-                import Scripts.TournamentBot.main as main_module
-                from ..ui.check_in import StartGameView
-                
                 # Create a new check-in session with the previous players
                 if stored_public_channel:
                     # Create the check-in embed
                     embed = discord.Embed(
                         title="Game Check-in (Auto Re-Check-in)",
                         description="New game session started! All players from the previous session have been automatically checked in.",
-                        color=discord.Color.blue()
+                        color=helpers.COLOR_BLUE
                     )
                     
                     # Create the check-in view
@@ -1017,50 +950,56 @@ class GlobalPhase3View(discord.ui.View):
                     # Store channel reference for future use
                     view.channel = stored_public_channel
                     
-                    # Debug print
-                    print(f"Creating new check-in with {len(previous_players)} players in channel {stored_public_channel.id}")
+                    logger.debug("Creating new check-in with %d players in channel %s", len(previous_players), stored_public_channel.id)
                     
-                    # Add all previous players to the checked-in list by retrieving them from the database
+                    # Resolve members from the guild cache first; only misses need the database
+                    members = {}
+                    if interaction.guild:
+                        for discord_id in previous_players:
+                            member = interaction.guild.get_member(int(discord_id))
+                            if member is not None:
+                                members[discord_id] = member
+                    
+                    # Look up the remaining players from the database with one query
+                    missing_ids = [discord_id for discord_id in previous_players if discord_id not in members]
+                    db_lookup = await databaseManager.get_players_info_bulk(missing_ids)
+                    
+                    # Add all previous players to the checked-in list
                     discord_users = []
-                    for player in previous_players:
-                        # Only add each player once (by discord_id)
-                        discord_id = player.discord_id
-                        if any(getattr(du, 'id', du.id) == discord_id for du in discord_users):
+                    for discord_id, username in previous_players.items():
+                        if discord_id in members:
+                            discord_users.append(members[discord_id])
                             continue
                         
-                        # Get the player info directly from the database using the proper function
-                        # This ensures we have the most current information for each player
-                        import databaseManager
-                        db_player = await databaseManager.get_player_info(discord_id)
-                        
+                        db_player = db_lookup.get(discord_id)
+                        dummy = DummyMember(discord_id)
                         if db_player:
                             # Create a Discord dummy member with database information
-                            from ..ui.check_in import DummyMember
-                            dummy = DummyMember(discord_id)
                             dummy.username = db_player.username
-                            discord_users.append(dummy)
-                            print(f"Successfully retrieved player {db_player.username} (ID: {discord_id}) from database")
                         else:
                             # Fallback if player not found in database (shouldn't happen)
-                            print(f"Warning: Player with ID {discord_id} not found in database, using original info")
-                            from ..ui.check_in import DummyMember
-                            dummy = DummyMember(discord_id)
-                            dummy.username = player.username
-                            discord_users.append(dummy)
+                            logger.warning("Player with ID %s not found in database, using original info", discord_id)
+                            dummy.username = username
+                        discord_users.append(dummy)
                     
                     # Set the checked in users
-                    view.checked_in_users = discord_users
-                    print(f"Added {len(discord_users)} users to the new check-in view")
+                    view.set_checked_in_users(discord_users)
+                    logger.debug("Added %d users to the new check-in view", len(discord_users))
                     
-                    # Update the embed with player list
-                    user_list = []
-                    for i, user in enumerate(view.checked_in_users):
-                        user_list.append(f"{i+1}. {getattr(user, 'mention', f'<@{user.id}>')}")
-                    
-                    if user_list:
+                    # Update the embed with player list; only the first 25 entries are shown
+                    user_count = len(view.checked_in_users)
+                    if user_count:
+                        # Members and DummyMembers both carry a mention
+                        user_list = "\n".join(
+                            f"{i+1}. {user.mention}"
+                            for i, user in enumerate(view.checked_in_users[:25])
+                        )
+                        hidden_count = user_count - 25
+                        if hidden_count > 0:
+                            user_list += f"\n...and {hidden_count} more"
                         embed.add_field(
-                            name=f"Checked-in Players ({len(view.checked_in_users)})",
-                            value="\n".join(user_list[:25]) + (f"\n...and {len(user_list) - 25} more" if len(user_list) > 25 else ""),
+                            name=f"Checked-in Players ({user_count})",
+                            value=user_list,
                             inline=False
                         )
                     
@@ -1071,35 +1010,20 @@ class GlobalPhase3View(discord.ui.View):
                         message = await stored_public_channel.send(embed=embed, view=view)
                         view.message_id = message.id
                         
-                        # Debug print
-                        print(f"Created new check-in message with ID: {message.id}")
+                        logger.debug("Created new check-in message with ID: %s", message.id)
                         
                         # Make sure to set the view in the global state BEFORE creating the control view
-                        import sys
-                        import Scripts.TournamentBot.main as main_module_direct
-                        main_module_direct.current_checkin_view = view
-                        print(f"Set current_checkin_view in main module direct reference: {id(view)}")
-                        print(f"Main module path: {sys.modules['Scripts.TournamentBot.main'].__file__}")
-                        print(f"Current checkin view is now: {main_module_direct.current_checkin_view is not None}")
-                        
-                        # Also set it the regular way to be extra safe
                         main_module.current_checkin_view = view
                         
-                        # Wait a moment to ensure the variable is properly set
-                        await asyncio.sleep(0.5)
-                        
                         # Create and send Phase 1 Global Controls to the admin channel
-                        from ..ui.game_control import GlobalPhasedControlView
-                        
                         # Create Phase 1 view (Start Game / Cancel Game)
                         phase1_view = GlobalPhasedControlView.create_phase1_view()
-                        print(f"After phase1_view creation, current_checkin_view is: {main_module_direct.current_checkin_view is not None}")
                         
                         # Create embed for global controls
                         gc_embed = discord.Embed(
                             title="Global Controls (Game Setup)",
                             description="Click 'Start Game' to begin the game session or 'Cancel Game' to cancel.",
-                            color=discord.Color.blue()
+                            color=helpers.COLOR_BLUE
                         )
                         
                         # Send global controls message to admin channel
@@ -1111,16 +1035,15 @@ class GlobalPhase3View(discord.ui.View):
                                     embed=gc_embed,
                                     view=phase1_view
                                 )
-                                print(f"Sent new global controls to admin channel: {admin_channel.id}, message ID: {admin_message.id}")
-                                print(f"Current check-in view after sending controls: {main_module.current_checkin_view is not None}")
-                                print(f"Sent new global controls to admin channel: {admin_channel.id}")
+                                logger.info("Sent new global controls to admin channel %s, message ID: %s", admin_channel.id, admin_message.id)
                         
                         await interaction.followup.send(
                             f"Game session completed! A new check-in has been automatically created with {len(view.checked_in_users)} players.",
                             ephemeral=True
                         )
+                        checkin_created = True
                     except Exception as e:
-                        print(f"Error creating new check-in: {e}")
+                        logger.exception("Error creating new check-in")
                         main_module.current_checkin_view = None
                         await interaction.followup.send(
                             f"Error creating new check-in: {str(e)}",
@@ -1135,10 +1058,9 @@ class GlobalPhase3View(discord.ui.View):
                     )
         except Exception as e:
             # Error handling for the entire process
-            print(f"Error in next_game_callback: {e}")
+            logger.exception("Error in next_game_callback")
             # Reset to avoid blocking the system
             GlobalGameState.reset_instance()
-            import Scripts.TournamentBot.main as main_module
             main_module.current_checkin_view = None
             
             await interaction.followup.send(
@@ -1148,34 +1070,48 @@ class GlobalPhase3View(discord.ui.View):
         # Remove the else clause that was resetting current_checkin_view to None
         # We don't want to clear it if we've already set up a new check-in session
         
-        # Fade out the buttons
-        gc_embed = discord.Embed(
-            title="Global Controls (Game Complete)",
-            description="The game session has ended. A new check-in has been created.",
-            color=discord.Color.dark_gold()
-        )
-        
-        # Create empty view
-        empty_view = discord.ui.View()
+        # Retire the global controls; the new session gets fresh controls in the admin channel
+        if checkin_created:
+            gc_embed = discord.Embed(
+                title="Global Controls (Game Complete)",
+                description="The game session has ended. A new check-in has been created.",
+                color=helpers.COLOR_DARK_GOLD
+            )
+        else:
+            gc_embed = discord.Embed(
+                title="Global Controls (Check-in Failed)",
+                description="The game session has ended, but a new check-in could not be created. Use /checkin to start a new session.",
+                color=helpers.COLOR_DARK_RED
+            )
         
-        # Edit the message
-        await interaction.message.edit(embed=gc_embed, view=empty_view)
+        try:
+            await interaction.message.edit(embed=gc_embed, view=None)
+        except Exception:
+            logger.exception("Error updating global controls")
     
     async def cancel_games_callback(self, interaction: discord.Interaction):
         """Cancelelled Games. Will No Longer Re-Check In"""
         # Get current game state
         game_state = self.global_state
         
+        # Create empty embed to show the games were cancelled
+        gc_embed = discord.Embed(
+            title="Global Controls (Games Cancelled)",
+            description="All games have been cancelled",
+            color=helpers.COLOR_DARK_RED
+        )
+        
+        # Stop listening for clicks and remove the buttons as the interaction response
+        self.stop()
+        await interaction.response.edit_message(embed=gc_embed, view=None)
+        
         # Disable all game-related buttons in all game messages
+        edits = []
         for game_index, message in game_state.game_messages.items():
-            if message:
-                try:
-                    # Keep the embed but remove all buttons
-                    embed = message.embeds[0] if message.embeds else None
-                    if embed:
-                        await message.edit(embed=embed, view=None)
-                except Exception as e:
-                    print(f"Error disabling buttons for game {game_index+1}: {e}")
+            # Keep the embed but remove all buttons, skipping messages that have none left
+            if message and message.embeds and game_index not in game_state.controls_cleared:
+                edits.append((f"disable buttons for game {game_index+1}", message.edit(embed=message.embeds[0], view=None)))
+        await game_state.run_message_edits(edits)
         
         # Reset the game state
         GlobalGameState.reset_instance()
@@ -1184,20 +1120,7 @@ class GlobalPhase3View(discord.ui.View):
         import Scripts.TournamentBot.main as main_module
         main_module.current_checkin_view = None
         
-        # Create empty embed to show the games were cancelled
-        gc_embed = discord.Embed(
-            title="Global Controls (Games Cancelled)",
-            description="All games have been cancelled",
-            color=discord.Color.dark_red()
-        )
-        
-        # Create empty view
-        empty_view = discord.ui.View()
-        
-        # Update the message
-        await interaction.message.edit(embed=gc_embed, view=empty_view)
-        
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "All games have been cancelled. Use /checkin to start a new session.",
             ephemeral=True
         )
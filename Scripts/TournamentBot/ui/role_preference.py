@@ -5,41 +5,44 @@ This module provides the UI elements for setting and submitting role preferences
 including dropdown selects and buttons.
 """
 import discord
+import logging
 from typing import List, Dict, Any, Optional, Tuple, Union
-import sys
-import os
-
-# First add the parent directory (TournamentBot) to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-# Then add the Scripts directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from local package using relative paths
 from ..utils import helpers
 
-# Import from parent directory
+# Import from the Scripts directory (main.py puts it on sys.path)
 import databaseManager
 
+logger = logging.getLogger(__name__)
+
+# Preference options shared by every role dropdown; nothing mutates them
+_PREF_OPTIONS = tuple(discord.SelectOption(label=str(i), value=str(i)) for i in range(1, 6))
+
+# Coalesces submitted (discord_id, preference) pairs into one database transaction
+_preference_batcher = helpers.PreferenceBatcher(databaseManager.set_role_preferences_bulk, max_size=8, wait=0.5)
+
+async def close_preference_batcher() -> None:
+    """Stop the preference batcher's worker; called when the bot shuts down."""
+    await _preference_batcher.close()
+
 class RoleSelect(discord.ui.Select):
     """Dropdown select for selecting role preference (1-5)."""
-    def __init__(self, role_name: str, index: int):
+    def __init__(self, role_name: str):
         """
         Initialize a role select dropdown.
         
         Args:
             role_name: Name of the role
-            index: Order of this role in the list
         """
-        options = [discord.SelectOption(label=str(i), value=str(i)) for i in range(1, 6)]
         super().__init__(
             placeholder=f"Select preference for {role_name}",
             min_values=1,
             max_values=1,
-            options=options,
+            options=list(_PREF_OPTIONS),
             custom_id=f"role_select_{role_name}"
         )
         self.role_name = role_name
-        self.order = index
         self.value = None
 
     async def callback(self, interaction: discord.Interaction):
@@ -59,8 +62,11 @@ class RolePreferenceView(discord.ui.View):
         """Initialize the role preference view with selects for each role."""
         super().__init__(timeout=None)
         self.roles = ["Top", "Jungle", "Mid", "Bot", "Support"]
-        for index, role in enumerate(self.roles):
-            self.add_item(RoleSelect(role, index))
+        self.selects = []  # RoleSelects in role order, read directly on submit
+        for role in self.roles:
+            select = RoleSelect(role)
+            self.selects.append(select)
+            self.add_item(select)
 
 
 class SubmitButton(discord.ui.Button):
@@ -85,21 +91,33 @@ class SubmitButton(discord.ui.Button):
             interaction: Discord interaction
         """
         try:
+            selects = self.dropdown_view.selects
+            
             # Check if all roles have preferences selected
-            for child in self.dropdown_view.children:
-                if isinstance(child, RoleSelect) and child.value is None:
-                    await interaction.response.send_message(
-                        "Please select a preference for all roles before submitting.",
-                        ephemeral=True
-                    )
-                    return
-
-            # Get the sorted preferences
-            sorted_selects = sorted(
-                [child for child in self.dropdown_view.children if isinstance(child, RoleSelect)],
-                key=lambda x: x.order
-            )
-            result = "".join(select.value for select in sorted_selects)
+            if any(select.value is None for select in selects):
+                await interaction.response.send_message(
+                    "Please select a preference for all roles before submitting.",
+                    ephemeral=True
+                )
+                return
+
+            # Acknowledge now so a slow database write can't outlast the interaction token
+            await interaction.response.defer()
+
+            # Preferences in role order
+            result = "".join(select.value for select in selects)
+
+            # Save the preference first (batched with other pending submits) so the
+            # dropdowns are only locked once it is actually stored
+            save_result = await _preference_batcher.submit((str(interaction.user.id), result))
+            
+            # The save reports a missing player as a message rather than an error
+            if not save_result.startswith("Updated role preference"):
+                await interaction.followup.send(
+                    f"Your preferences could not be saved: {save_result}. Please contact an admin.",
+                    ephemeral=True
+                )
+                return
 
             # Update the original message with the result
             original_embed = self.dropdown_msg.embeds[0]
@@ -110,20 +128,16 @@ class SubmitButton(discord.ui.Button):
             new_embed.add_field(name="Result", value=result, inline=False)
 
             # Disable all dropdown selects
-            for child in self.dropdown_view.children:
-                child.disabled = True
+            helpers.disable_view(self.dropdown_view)
             await self.dropdown_msg.edit(embed=new_embed, view=self.dropdown_view)
-
-            # Save the role preference to the database
-            await databaseManager.set_role_preference(str(interaction.user.id), result)
             
             # Disable the submit button
             self.disabled = True
-            await interaction.response.edit_message(view=self.view)
+            await interaction.edit_original_response(view=self.view)
             await interaction.followup.send("Preferences submitted and saved!", ephemeral=True)
 
         except Exception as e:
-            print(f"Error in submit callback: {e}")
+            logger.exception("Error in submit callback")
             await helpers.safe_respond(
                 interaction,
                 content=f"An error occurred while submitting preferences: {str(e)}. Please try again.",
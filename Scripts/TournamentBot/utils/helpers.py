@@ -6,6 +6,11 @@ This module provides helper functions and constants used throughout the bot.
 import discord
 from typing import Optional, List, Dict, Any, Tuple, Union
 import asyncio
+import logging
+import operator
+import time
+
+logger = logging.getLogger(__name__)
 
 # Constants
 ROLE_NAMES = ["Top", "Jun", "Mid", "Bot", "Sup"]
@@ -23,8 +28,52 @@ COLOR_RED = discord.Color.red()
 COLOR_GREEN = discord.Color.green()
 COLOR_GOLD = discord.Color.gold()
 COLOR_PURPLE = discord.Color.purple()
+COLOR_DARK_GOLD = discord.Color.dark_gold()
+COLOR_DARK_RED = discord.Color.dark_red()
+
+# Role names (lowercase) that grant admin access to the bot
+ADMIN_ROLE_NAMES = frozenset({"admin", "moderator", "mod"})
+
+# Seconds an admin permission result is reused for the same member
+ADMIN_CACHE_TTL = 60
+
+# Most members whose admin permission result is cached at once
+ADMIN_CACHE_MAX_SIZE = 256
+
+# Maps (guild_id, user_id) to (checked_at, is_admin), oldest check first
+_admin_cache: Dict[Tuple[int, int], Tuple[float, bool]] = {}
+
+# (role name, emoji) for each team slot, in role order
+_ROLE_VISUALS = tuple((role_name, ROLE_EMOJIS.get(role_name, "")) for role_name in ROLE_NAMES)
+
+# Fetches (username, tier, rank) from a player in one call
+_player_attrs = operator.attrgetter("username", "tier", "rank")
 
 # Discord message/embed formatting functions
+def _format_team_field(team: List[Any]) -> str:
+    """
+    Format a team's players for an embed field, one block per role.
+    
+    Args:
+        team: Players in role order
+        
+    Returns:
+        The field text, or an empty string for an empty team
+    """
+    parts = []
+    for (role_name, emoji), player in zip(_ROLE_VISUALS, team):
+        try:
+            player_name, player_tier, player_rank = _player_attrs(player)
+        except AttributeError:
+            player_name, player_tier, player_rank = "Unknown", "Unknown", "Unknown"
+
+        parts.append(f"{emoji}\n"
+                     f"**{role_name}**: {player_name}\n"
+                     f"**Rank**: {player_rank}\n"
+                     f"**Tier**: {player_tier}\n\n"
+                     )
+    return "".join(parts)
+
 def create_game_embed(game_data: Dict[str, Any], game_index: int) -> discord.Embed:
     """
     Create a standardized embed for game display.
@@ -48,48 +97,20 @@ def create_game_embed(game_data: Dict[str, Any], game_index: int) -> discord.Emb
     else:
         embed = discord.Embed(title=f"Game {game_index + 1}", color=COLOR_PURPLE)
     
-    # Add blue team field
-    blue_field_value = ""
-    for i, player in enumerate(blue_team):
-        role_name = ROLE_NAMES[i]
-        emoji = ROLE_EMOJIS.get(role_name, "")
-        player_name = getattr(player, "username", "Unknown")
-        player_tier = getattr(player, "tier", "Unknown")
-        player_rank = getattr(player, "rank", "Unknown")
-
-        blue_field_value += (f"{emoji}\n"
-                             f"**{role_name}**: {player_name}\n"
-                             f"**Rank**: {player_rank}\n"  
-                             f"**Tier**: {player_tier}\n\n"
-                             )
-    
-    embed.add_field(name="Blue Team", value=blue_field_value or "No players", inline=True)
-    
-    # Add red team field
-    red_field_value = ""
-    for i, player in enumerate(red_team):
-        role_name = ROLE_NAMES[i]
-        emoji = ROLE_EMOJIS.get(role_name, "")
-        player_name = getattr(player, "username", "Unknown")
-        player_tier = getattr(player, "tier", "Unknown")
-        player_rank = getattr(player, "rank", "Unknown")
-
-        red_field_value += (f"{emoji}\n" 
-                            f"**{role_name}**: {player_name}\n"
-                            f"**Rank**: {player_rank}\n"  
-                            f"**Tier**: {player_tier}\n\n"
-                             )
-    
-    embed.add_field(name="Red Team", value=red_field_value or "No players", inline=True)
+    # Add one field per team
+    embed.add_field(name="Blue Team", value=_format_team_field(blue_team) or "No players", inline=True)
+    embed.add_field(name="Red Team", value=_format_team_field(red_team) or "No players", inline=True)
     
     # Add MVP if available
     mvp_id = game_data.get("mvp", None)
     if mvp_id:
-        for team in [blue_team, red_team]:
-            for player in team:
-                if getattr(player, "discord_id", None) == mvp_id:
-                    embed.add_field(name="MVP", value=getattr(player, "username", "Unknown"), inline=False)
-                    break
+        # Stop at the first match across both teams
+        mvp = next(
+            (player for player in (*blue_team, *red_team) if getattr(player, "discord_id", None) == mvp_id),
+            None
+        )
+        if mvp is not None:
+            embed.add_field(name="MVP", value=getattr(mvp, "username", "Unknown"), inline=False)
     
     return embed
 
@@ -105,10 +126,9 @@ def create_sitting_out_embed(players: List[Any]) -> discord.Embed:
     """
     embed = discord.Embed(title="Players Sitting Out", color=COLOR_GOLD)
     
-    player_list = ""
-    for i, player in enumerate(players):
-        player_name = getattr(player, "username", "Unknown")
-        player_list += f"{i+1}. {player_name}\n"
+    player_list = "".join(
+        f"{i+1}. {getattr(player, 'username', 'Unknown')}\n" for i, player in enumerate(players)
+    )
     
     embed.description = player_list or "No players sitting out"
     return embed
@@ -135,27 +155,34 @@ async def safe_respond(
         True if response was successful, False otherwise
     """
     try:
-        if interaction.response.is_done():
-            # If already responded, use followup
-            await interaction.followup.send(
-                content=content,
-                embed=embed,
-                view=view,
-                ephemeral=ephemeral
-            )
-        else:
-            # Initial response
-            await interaction.response.send_message(
-                content=content,
-                embed=embed,
-                view=view,
-                ephemeral=ephemeral
-            )
+        response = interaction.response
+        # If already responded, use followup; otherwise send the initial response
+        send = interaction.followup.send if response.is_done() else response.send_message
+        await send(
+            content=content,
+            embed=embed,
+            view=view,
+            ephemeral=ephemeral
+        )
         return True
     except Exception as e:
         print(f"Error responding to interaction: {e}")
         return False
 
+def disable_view(view: discord.ui.View) -> discord.ui.View:
+    """
+    Disable every item of a view in place.
+    
+    Args:
+        view: View whose items should be disabled
+        
+    Returns:
+        The same view, for passing straight to a message edit
+    """
+    for item in view.children:
+        item.disabled = True
+    return view
+
 
 # Permission helpers
 def has_admin_permission(member: discord.Member) -> bool:
@@ -168,8 +195,162 @@ def has_admin_permission(member: discord.Member) -> bool:
     Returns:
         True if member has admin permissions, False otherwise
     """
+    # guild_permissions is recomputed from the member's roles on every access
+    permissions = member.guild_permissions
     return (
-        member.guild_permissions.administrator or
-        member.guild_permissions.manage_guild or
-        any(role.name.lower() in ["admin", "moderator", "mod"] for role in member.roles)
-    )
\ No newline at end of file
+        permissions.administrator or
+        permissions.manage_guild or
+        any(role.name.lower() in ADMIN_ROLE_NAMES for role in member.roles)
+    )
+
+
+def has_admin_permission_cached(member: discord.Member) -> bool:
+    """
+    Check if a member has admin permissions, reusing recent results.
+    
+    Results are cached per guild and user for ADMIN_CACHE_TTL seconds. Role
+    changes seen by on_member_update drop the member's entry right away.
+    Expired entries are dropped when they are looked up, and the cache never
+    holds more than ADMIN_CACHE_MAX_SIZE members.
+    
+    Args:
+        member: Discord member to check
+        
+    Returns:
+        True if member has admin permissions, False otherwise
+    """
+    guild = getattr(member, "guild", None)
+    if guild is None:
+        return has_admin_permission(member)
+    
+    key = (guild.id, member.id)
+    now = time.monotonic()
+    cached = _admin_cache.get(key)
+    if cached is not None:
+        if now - cached[0] < ADMIN_CACHE_TTL:
+            return cached[1]
+        # Drop the expired entry so the fresh result is stored as the newest check
+        del _admin_cache[key]
+    
+    # Make room by dropping the oldest checks; entries are kept in check order
+    while len(_admin_cache) >= ADMIN_CACHE_MAX_SIZE:
+        del _admin_cache[next(iter(_admin_cache))]
+    
+    is_admin = has_admin_permission(member)
+    _admin_cache[key] = (now, is_admin)
+    return is_admin
+
+
+def invalidate_admin_cache(guild_id: int, user_id: int) -> None:
+    """
+    Drop a member's cached admin permission result.
+    
+    Args:
+        guild_id: ID of the member's guild
+        user_id: ID of the member
+    """
+    _admin_cache.pop((guild_id, user_id), None)
+
+
+# Batching helpers
+class PreferenceBatcher:
+    """
+    Coalesce items submitted from many interactions into batched flushes.
+    
+    Items are collected by a background task and passed to the flush
+    coroutine. An item that arrives alone is flushed at once; when others are
+    already queued, the batch is flushed once max_size items are waiting or
+    wait seconds have passed since the first one arrived, whichever comes first.
+    """
+    def __init__(self, flush, max_size: int = 8, wait: float = 0.5):
+        """
+        Initialize the batcher.
+        
+        Args:
+            flush: Coroutine function taking a list of items and returning one result per item
+            max_size: Most items passed to a single flush
+            wait: Most seconds to wait for more items once a batch has started
+        """
+        self.flush = flush
+        self.max_size = max_size
+        self.wait = wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for the batch containing it to be flushed.
+        
+        Args:
+            item: Item to pass to the flush coroutine
+            
+        Returns:
+            The flush result for this item
+        """
+        # The queue and worker are created on first use so they belong to the bot's event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Cancel the worker and cancel any items still waiting to be flushed."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    async def _run(self) -> None:
+        """Drain the queue in batches until the task is cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # A lone submit is flushed at once; only wait for more when others are already queued
+                if not self._queue.empty():
+                    deadline = loop.time() + self.wait
+                    while len(batch) < self.max_size:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+                
+                results = await self.flush([item for item, _ in batch])
+            except asyncio.CancelledError:
+                # Items taken off the queue would otherwise be left waiting forever
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.exception("Error flushing batch")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            if len(results) != len(batch):
+                logger.error("Batch flush returned %d results for %d items", len(results), len(batch))
+                error = RuntimeError("Batch flush returned the wrong number of results")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
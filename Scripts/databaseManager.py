@@ -5,6 +5,7 @@ from dotenv import load_dotenv, find_dotenv
 import discord
 import aiohttp
 import asyncio
+import time
 
 load_dotenv(find_dotenv())
 DB_PATH = os.getenv('DB_PATH')
@@ -14,6 +15,33 @@ db_directory = os.path.dirname(DB_PATH)
 if not os.path.exists(db_directory):
     os.makedirs(db_directory, exist_ok=True)
 
+# Seconds a Player read by get_player_info is reused before the database is read again
+PLAYER_CACHE_TTL = 60
+
+# Maps DiscordID to (fetched_at, PlayerStats row); every PlayerStats write invalidates its rows.
+# Rows are cached rather than Players because callers such as matchmaking mutate the Player they get.
+_player_cache = {}
+
+def invalidate_player(discord_id=None):
+    """
+    Drop a player from the get_player_info cache.
+    With no discord_id, every cached player is dropped.
+    """
+    if discord_id is None:
+        _player_cache.clear()
+    else:
+        _player_cache.pop(str(discord_id), None)
+
+def _cached_player(discord_id):
+    """
+    Return a new Player built from the cached row for a DiscordID,
+    or None if it is missing or expired.
+    """
+    cached = _player_cache.get(discord_id)
+    if cached is not None and time.monotonic() - cached[0] < PLAYER_CACHE_TTL:
+        return _player_from_row(cached[1])
+    return None
+
 async def initialize_database():
     async with aiosqlite.connect(DB_PATH) as conn:
         # Create PlayerStats table
@@ -125,6 +153,8 @@ async def update_wins(winners):
                     )
                     await update_win_rate(conn, str(winner.discord_id))
         await conn.commit()
+    for winner in winners:
+        invalidate_player(winner.discord_id)
 
 
 
@@ -149,8 +179,37 @@ async def update_points(member):
         
         await conn.execute("UPDATE PlayerStats SET Participation = Participation + 1, TotalPoints = TotalPoints + 1 WHERE DiscordID = ?", (member,))
         await conn.commit()
+        invalidate_player(member)
         return f"Added 1 participation point to {member}."
 
+async def update_points_bulk(members):
+    """
+    Add a participation point to several players in a single transaction.
+    Returns one result message per member, in the same form as update_points.
+    """
+    members = [str(member) for member in members]
+    if not members:
+        return []
+    placeholders = ", ".join("?" for _ in members)
+    async with aiosqlite.connect(DB_PATH) as conn:
+        async with conn.execute(
+            f"SELECT DiscordID FROM PlayerStats WHERE DiscordID IN ({placeholders})", members
+        ) as cursor:
+            existing = {row[0] for row in await cursor.fetchall()}
+        
+        await conn.execute(
+            f"UPDATE PlayerStats SET Participation = Participation + 1, TotalPoints = TotalPoints + 1 WHERE DiscordID IN ({placeholders})",
+            members
+        )
+        await conn.commit()
+    for member in members:
+        invalidate_player(member)
+    return [
+        f"Added 1 participation point to {member}." if member in existing
+        else f"Failed to update: {member} (user not found in database)."
+        for member in members
+    ]
+
 async def check_and_update_rank(player_id: str, riot_id: str):
     """
     Check if a player's rank has changed by fetching current rank from Riot API.
@@ -241,6 +300,7 @@ async def check_and_update_rank(player_id: str, riot_id: str):
                                     (api_rank, api_tier, player_id)
                                 )
                                 await conn.commit()
+                                invalidate_player(player_id)
                                 
                                 return True, f"Your rank has changed from {current_db_rank} to {api_rank}!"
                             
@@ -270,6 +330,7 @@ async def update_username(player):
                         (current_username, str(player.id))
                     )
                     await conn.commit()
+                    invalidate_player(player.id)
                     print(f"Updated username for {player.id} to '{current_username}'.")
             else:
                 # Insert new player if they don't exist
@@ -279,6 +340,7 @@ async def update_username(player):
                     (str(player.id), current_username)
                 )
                 await conn.commit()
+                invalidate_player(player.id)
                 print(f"Added new player {player.id} with username '{current_username}'.")
     except Exception as e:
         print(f"Error updating username: {e}")
@@ -415,6 +477,7 @@ async def link(member, riot_id: str):
                     )
 
                 await conn.commit()
+                invalidate_player(member.id)
                 
                 # Formulate a message including the rank
                 rank_message = f" Your rank has been determined to be {player_rank}."
@@ -460,6 +523,7 @@ async def update_toxicity_by_id(discord_id: str):
                 (toxicity_points + 1, toxicity_points + 1, discord_id)
             )
             await conn.commit()
+            invalidate_player(discord_id)
             return True  # Successfully updated
 
         return False  # User not found
@@ -479,6 +543,7 @@ async def remove_user(member):
         
         await conn.execute("DELETE FROM PlayerStats WHERE DiscordID = ?", (member,))
         await conn.commit()
+    invalidate_player(member)
     
     return f"User {member} has been removed from the database."
 
@@ -507,6 +572,7 @@ async def unlink_riot_id(discord_id: str):
             (discord_id,)
         )
         await conn.commit()
+        invalidate_player(discord_id)
         
         return f"Successfully unlinked Riot ID '{current_riot_id}' from your Discord account."
 
@@ -560,45 +626,44 @@ async def update_all_player_stats(game_data, result, mvp_id=None):
         result: String indicating which team won ('blue' or 'red')
         mvp_id: Discord ID of the MVP player (or None if MVP voting was skipped)
     """
+    blue_team = game_data["blue"]
+    red_team = game_data["red"]
+    all_players = blue_team + red_team
+    
+    # Determine winning team
+    winners = blue_team if result == "blue" else red_team
+    
+    all_ids = [str(player.discord_id) for player in all_players]
+    winner_ids = [str(player.discord_id) for player in winners]
+    all_placeholders = ", ".join("?" for _ in all_ids)
+    winner_placeholders = ", ".join("?" for _ in winner_ids)
+    
+    # Every update below covers the whole match in one statement and is committed once
     async with aiosqlite.connect(DB_PATH) as conn:
-        blue_team = game_data["blue"]
-        red_team = game_data["red"]
-        all_players = blue_team + red_team
-        
-        # Determine winning team
-        winners = blue_team if result == "blue" else red_team
-        
-        # Update all players' participation and games played
-        for player in all_players:
-            player_id = str(player.discord_id)
-            
-            # Check if player exists in database
-            async with conn.execute("SELECT * FROM PlayerStats WHERE DiscordID = ?", (player_id,)) as cursor:
-                player_exists = await cursor.fetchone()
-            
-            if not player_exists:
+        # Warn about players missing from the database; the updates skip them
+        async with conn.execute(
+            f"SELECT DiscordID FROM PlayerStats WHERE DiscordID IN ({all_placeholders})", all_ids
+        ) as cursor:
+            existing_ids = {row[0] for row in await cursor.fetchall()}
+        for player_id in all_ids:
+            if player_id not in existing_ids:
                 print(f"Warning: Player {player_id} not found in database.")
-                continue
-            
-            # Update participation for all players
-            await conn.execute(
-                "UPDATE PlayerStats SET Participation = Participation + 1 WHERE DiscordID = ?",
-                (player_id,)
-            )
-            
-            # Update games played for all players
-            await conn.execute(
-                "UPDATE PlayerStats SET GamesPlayed = GamesPlayed + 1 WHERE DiscordID = ?",
-                (player_id,)
-            )
+        
+        # Update participation and games played for all players
+        await conn.execute(
+            f"""
+            UPDATE PlayerStats
+            SET Participation = Participation + 1, GamesPlayed = GamesPlayed + 1
+            WHERE DiscordID IN ({all_placeholders})
+            """,
+            all_ids
+        )
         
         # Update wins for winning team
-        for player in winners:
-            player_id = str(player.discord_id)
-            await conn.execute(
-                "UPDATE PlayerStats SET Wins = Wins + 1 WHERE DiscordID = ?",
-                (player_id,)
-            )
+        await conn.execute(
+            f"UPDATE PlayerStats SET Wins = Wins + 1 WHERE DiscordID IN ({winner_placeholders})",
+            winner_ids
+        )
         
         # Update MVP stat if applicable
         if mvp_id:
@@ -607,21 +672,20 @@ async def update_all_player_stats(game_data, result, mvp_id=None):
                 (mvp_id,)
             )
         
-        # Update TotalPoints for all players
-        for player in all_players:
-            player_id = str(player.discord_id)
-            
-            # TotalPoints = Participation + Wins + MVPs - ToxicityPoints
-            await conn.execute("""
-                UPDATE PlayerStats
-                SET TotalPoints = Participation + Wins + MVPs - ToxicityPoints
-                WHERE DiscordID = ?
-            """, (player_id,))
-            
-            # Update win rate
-            await update_win_rate(conn, player_id)
+        # TotalPoints = Participation + Wins + MVPs - ToxicityPoints, and recalculate win rate
+        await conn.execute(
+            f"""
+            UPDATE PlayerStats
+            SET TotalPoints = Participation + Wins + MVPs - ToxicityPoints,
+                WinRate = CASE WHEN GamesPlayed > 0 THEN (Wins * 100.0) / GamesPlayed ELSE 0 END
+            WHERE DiscordID IN ({all_placeholders})
+            """,
+            all_ids
+        )
         
         await conn.commit()
+    for player_id in all_ids:
+        invalidate_player(player_id)
 
 # function that adds an mvp point to a player
 # This function is kept for backward compatibility but is no longer used directly
@@ -638,6 +702,7 @@ async def add_mvp_point(member):
         
         await conn.execute("UPDATE PlayerStats SET MVPs = MVPs + 1, TotalPoints = TotalPoints + 1 WHERE DiscordID = ?", (member,))
         await conn.commit()
+    invalidate_player(member)
     
     return f"User {member} has received an MVP point"
 
@@ -655,9 +720,42 @@ async def set_role_preference(member, preference: str):
         # adds role preference
         await conn.execute("Update PlayerStats SET RolePreference = ? WHERE DiscordID = ?", (preference, member))
         await conn.commit()
+    invalidate_player(member)
 
     return f"Updated role preference for {member} to {preference}."
 
+async def set_role_preferences_bulk(pairs):
+    """
+    Save several role preferences in a single transaction.
+    Returns one result message per pair, in the same form as set_role_preference.
+
+    Args:
+        pairs: (discord_id, preference) tuples; later pairs win for repeated IDs
+    """
+    pairs = [(str(member), preference) for member, preference in pairs]
+    if not pairs:
+        return []
+    members = list({member for member, _ in pairs})
+    placeholders = ", ".join("?" for _ in members)
+    async with aiosqlite.connect(DB_PATH) as conn:
+        async with conn.execute(
+            f"SELECT DiscordID FROM PlayerStats WHERE DiscordID IN ({placeholders})", members
+        ) as cursor:
+            existing = {row[0] for row in await cursor.fetchall()}
+
+        await conn.executemany(
+            "UPDATE PlayerStats SET RolePreference = ? WHERE DiscordID = ?",
+            [(preference, member) for member, preference in pairs if member in existing]
+        )
+        await conn.commit()
+    for member in existing:
+        invalidate_player(member)
+    return [
+        f"Updated role preference for {member} to {preference}." if member in existing
+        else "This user cannot be found"
+        for member, preference in pairs
+    ]
+
 async def update_games_played(member):
     async with aiosqlite.connect(DB_PATH) as conn:
         # Use member.discord_id instead of member.id for Player objects
@@ -670,12 +768,56 @@ async def update_games_played(member):
             # Recalculate win rate (wins remains unchanged)
             await update_win_rate(conn, str(member.discord_id))
             await conn.commit()
+            invalidate_player(member.discord_id)
+
+async def update_match_results_bulk(winner_ids, loser_ids):
+    """
+    Record a game's outcome for both teams in a single transaction.
+    
+    Winners get a win and a game played, losers get a game played, and the
+    win rate of every player involved is recalculated before one commit.
+    
+    Args:
+        winner_ids: Discord IDs of the winning players
+        loser_ids: Discord IDs of the losing players
+    """
+    winner_ids = [str(discord_id) for discord_id in winner_ids]
+    loser_ids = [str(discord_id) for discord_id in loser_ids]
+    all_ids = winner_ids + loser_ids
+    if not all_ids:
+        return
+    async with aiosqlite.connect(DB_PATH) as conn:
+        if winner_ids:
+            placeholders = ", ".join("?" for _ in winner_ids)
+            await conn.execute(
+                f"UPDATE PlayerStats SET Wins = Wins + 1, GamesPlayed = GamesPlayed + 1 WHERE DiscordID IN ({placeholders})",
+                winner_ids
+            )
+        if loser_ids:
+            placeholders = ", ".join("?" for _ in loser_ids)
+            await conn.execute(
+                f"UPDATE PlayerStats SET GamesPlayed = GamesPlayed + 1 WHERE DiscordID IN ({placeholders})",
+                loser_ids
+            )
+        placeholders = ", ".join("?" for _ in all_ids)
+        await conn.execute(
+            f"""
+            UPDATE PlayerStats
+            SET WinRate = CASE WHEN GamesPlayed > 0 THEN (Wins * 100.0) / GamesPlayed ELSE 0 END
+            WHERE DiscordID IN ({placeholders})
+            """,
+            all_ids
+        )
+        await conn.commit()
+    for discord_id in all_ids:
+        invalidate_player(discord_id)
 
 async def clear_database():
     async with aiosqlite.connect(DB_PATH) as conn:
         await conn.execute("DELETE FROM PlayerStats")
         await conn.commit()
         print("Database cleared successfully.")
+    invalidate_player()
 
 async def add_30_players_with_ranks():
     # Ranks from lowest to highest
@@ -744,6 +886,7 @@ async def add_30_players_with_ranks():
         
         await conn.commit()
         print("30 players with ranks have been added to the database.")
+    invalidate_player()
 
 class Player:
     def __init__(self, discord_id, username, player_riot_id, participation, wins, mvps,
@@ -779,6 +922,33 @@ class Player:
                 
         return preferred_roles
 
+_PLAYER_INFO_COLUMNS = """DiscordID, DiscordUsername, PlayerRiotID, Participation, Wins, MVPs, 
+               ToxicityPoints, GamesPlayed, WinRate, TotalPoints, PlayerTier, PlayerRank, RolePreference"""
+
+def _player_from_row(row) -> Player:
+    """
+    Build a Player from a PlayerStats row selected with _PLAYER_INFO_COLUMNS.
+    """
+    (id_val, username, player_riot_id, participation, wins, mvps, toxicity_points,
+     games_played, win_rate, total_points, tier, rank, role_pref_str) = row
+    # Convert the role preference string into a list of integers (e.g. "15432" -> [1,5,4,3,2])
+    role_preference = [int(ch) for ch in role_pref_str] if role_pref_str else []
+    return Player(
+        discord_id=id_val,
+        username=username,
+        player_riot_id=player_riot_id,
+        participation=participation,
+        wins=wins,
+        mvps=mvps,
+        toxicity_points=toxicity_points,
+        games_played=games_played,
+        win_rate=win_rate,
+        total_points=total_points,
+        tier=tier,
+        rank=rank,
+        role_preference=role_preference
+    )
+
 async def get_player_info(discord_id: str) -> Player:
     """
     Retrieve player information from the database based on DiscordID.
@@ -786,11 +956,14 @@ async def get_player_info(discord_id: str) -> Player:
       - discord_id, username, player_riot_id, participation, wins, mvps,
       - toxicity_points, games_played, win_rate, total_points, tier, rank, 
       - role_preference (stored as a list of integers).
+    Results are cached for PLAYER_CACHE_TTL seconds and dropped on every write.
     """
+    cached = _cached_player(discord_id)
+    if cached is not None:
+        return cached
     async with aiosqlite.connect(DB_PATH) as conn:
-        query = """
-        SELECT DiscordID, DiscordUsername, PlayerRiotID, Participation, Wins, MVPs, 
-               ToxicityPoints, GamesPlayed, WinRate, TotalPoints, PlayerTier, PlayerRank, RolePreference
+        query = f"""
+        SELECT {_PLAYER_INFO_COLUMNS}
         FROM PlayerStats
         WHERE DiscordID = ?
         """
@@ -798,28 +971,43 @@ async def get_player_info(discord_id: str) -> Player:
             result = await cursor.fetchone()
 
     if result:
-        (id_val, username, player_riot_id, participation, wins, mvps, toxicity_points,
-         games_played, win_rate, total_points, tier, rank, role_pref_str) = result
-        # Convert the role preference string into a list of integers (e.g. "15432" -> [1,5,4,3,2])
-        role_preference = [int(ch) for ch in role_pref_str] if role_pref_str else []
-        player = Player(
-            discord_id=id_val,
-            username=username,
-            player_riot_id=player_riot_id,
-            participation=participation,
-            wins=wins,
-            mvps=mvps,
-            toxicity_points=toxicity_points,
-            games_played=games_played,
-            win_rate=win_rate,
-            total_points=total_points,
-            tier=tier,
-            rank=rank,
-            role_preference=role_preference
-        )
+        player = _player_from_row(result)
+        _player_cache[player.discord_id] = (time.monotonic(), result)
         return player
     return None
 
+async def get_players_info_bulk(discord_ids) -> dict:
+    """
+    Retrieve player information for several DiscordIDs with a single query.
+    Returns a dict mapping DiscordID to Player; IDs with no row are left out.
+    Cached players are reused and only the rest are queried.
+    """
+    players = {}
+    missing_ids = []
+    for discord_id in discord_ids:
+        cached = _cached_player(discord_id)
+        if cached is not None:
+            players[discord_id] = cached
+        else:
+            missing_ids.append(discord_id)
+    if not missing_ids:
+        return players
+    async with aiosqlite.connect(DB_PATH) as conn:
+        placeholders = ", ".join("?" for _ in missing_ids)
+        query = f"""
+        SELECT {_PLAYER_INFO_COLUMNS}
+        FROM PlayerStats
+        WHERE DiscordID IN ({placeholders})
+        """
+        async with conn.execute(query, missing_ids) as cursor:
+            rows = await cursor.fetchall()
+    now = time.monotonic()
+    for row in rows:
+        player = _player_from_row(row)
+        players[player.discord_id] = player
+        _player_cache[player.discord_id] = (now, row)
+    return players
+
 async def main():
     await initialize_database()
     await clear_database()